@@ -21,6 +21,7 @@
     matplotlib RangeSlider:  https://matplotlib.org/stable/gallery/widgets/range_slider.html
     matplotlib Snapping Sliders to Discrete Values:  https://matplotlib.org/stable/gallery/widgets/slider_snap_demo.html
     matplotlib datetime with slider widget:  https://stackoverflow.com/questions/31015755/datetime-with-slider-widget-in-matplotlib
+    matplotlib blitting:  https://matplotlib.org/stable/users/explain/animations/blitting.html
 @todo:
     20240501 (completed 20240511) create GUI for user input vs console; use Tkinter windows classes
     20240504 (completed 20240505) show selected drawing as circles like balls on bars
@@ -37,22 +38,38 @@
 
 import os
 import sys
+import time
+import argparse
 import pandas as pd
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import date
-from matplotlib.widgets import RangeSlider, Slider
+from matplotlib.widgets import Button, RangeSlider, Slider
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path as MplPath
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D, IdentityTransform
 from pathlib import Path
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import ttk
 import debug as dbg
+import lottery_db as ldb
+from draw_store import DrawStore
+import lottery_analysis as la
+import lottery_ingest as lingest
+import lottery_scan as lscan
+import lottery_memory as lmem
 
 #############
 # CONSTANTS #
 #############
 # note:  ball range from 1 to max ball + 2, because range stop value is exclusive 
 #        and need 1 more after last ball as bin for histogram 
+# note:  'eras' lists rule changes of each game (first draw date and ball ranges, 
+#        same convention); last era = current rules
 APP_NAME = "Lottery Summary"
 APP_VERSION = "1.0.0"
 LOTTERY_INFO = {0: 
@@ -60,17 +77,55 @@ LOTTERY_INFO = {0:
                  'balls range': range(1,71),
                  'special range': range(1,28),
                  'path internet': 'https://www.texaslottery.com/export/sites/lottery/Games/Powerball/Winning_Numbers/powerball.csv',
-                 'path local': 'Powerball/Powerball.csv'},
+                 'path local': 'Powerball/Powerball.csv',
+                 'path glob': 'Powerball/*.csv',
+                 'eras': [{'start': '2009-01-07', 'balls range': range(1,61), 'special range': range(1,41)},
+                          {'start': '2012-01-15', 'balls range': range(1,61), 'special range': range(1,37)},
+                          {'start': '2015-10-07', 'balls range': range(1,71), 'special range': range(1,28)}]},
                 1: 
                  {'name': 'Mega Millions',
                  'balls range': range(1,72),
                  'special range': range(1,27),
                  'path internet': 'https://www.texaslottery.com/export/sites/lottery/Games/Mega_Millions/Winning_Numbers/megamillions.csv',
-                 'path local': 'MegaMillions/MegaMillions.csv'}}
+                 'path local': 'MegaMillions/MegaMillions.csv',
+                 'path glob': 'MegaMillions/*.csv',
+                 'eras': [{'start': '2002-05-17', 'balls range': range(1,54), 'special range': range(1,54)},
+                          {'start': '2005-06-22', 'balls range': range(1,58), 'special range': range(1,48)},
+                          {'start': '2013-10-22', 'balls range': range(1,77), 'special range': range(1,17)},
+                          {'start': '2017-10-31', 'balls range': range(1,72), 'special range': range(1,27)}]}}
+
+# key navigation of Draw Date slider:  key -> (direction, days)
+NAV_CALENDAR_KEYS = {'shift+right': (1, 7), 'shift+left': (-1, 7),
+                     'ctrl+right': (1, 30), 'ctrl+left': (-1, 30),
+                     'pagedown': (1, 365), 'pageup': (-1, 365),
+                     'alt+right': (1, 365), 'alt+left': (-1, 365)}
+# same navigation key pressed again within this time (key repeat) doubles the step, up to NAV_REPEAT_MAX
+NAV_REPEAT_SECONDS = 0.25
+NAV_REPEAT_MAX = 64
+
+# ball markers of draw selected by Draw Date slider:  circle diameter in points,
+# height of number labels relative to circle and marker heights in axes (fraction)
+MARKER_SIZE = 13
+MARKER_LABEL_HEIGHT = 0.42
+MARKER_Y = [np.arange(5) / 5, np.array([2 / 5])]
+MARKER_CIRCLE = MplPath.unit_circle().transformed(Affine2D().scale(0.5))
 
 #############
 # FUNCTIONS #
 #############
+def ballLabelPath(text):
+    """
+    Returns
+    -------
+    matplotlib Path of text centered at (0, 0) in marker units (1 = marker
+    size), digits MARKER_LABEL_HEIGHT high.
+
+    """
+    path = TextPath((0, 0), text, size=1)
+    scale = MARKER_LABEL_HEIGHT / TextPath((0, 0), "0", size=1).get_extents().height
+    ext = path.get_extents()
+    return path.transformed(Affine2D().translate(-(ext.x0 + ext.x1) / 2, -(ext.y0 + ext.y1) / 2).scale(scale))
+
 def colorPatches(N, P):
     """
     Parameters
@@ -104,8 +159,7 @@ def inputLotteryData():
         print(f"{i} = {LOTTERY_INFO[i]['name']}")  
     idx = int(input("Which lottery? "))
     
-    lot = Lottery
-    lot.info = LOTTERY_INFO[idx]
+    lot = Lottery(LOTTERY_INFO[idx])
 
     # select source for data
     source = input("Source ['I' = Internet, 'L' = Local File]? ")
@@ -127,7 +181,8 @@ def inputLotteryData():
            
     # import data
     try:
-        df_import = pd.read_csv(sourceFile)
+        csv_source = lingest.fetchSource(sourceFile)
+        df_import = pd.read_csv(csv_source, header=0 if lingest.hasHeader(csv_source) else None, names=lingest.CSV_COLUMN_NAMES)
     except:
         sys.exit(3)
         
@@ -180,15 +235,195 @@ def inputLotteryData():
                       desired_column_names[5]: s_Num5,
                       desired_column_names[6]: s_Special}
     
-    # create pandas DataFrame with lottery history
-    lot.df_data = pd.DataFrame(dictDataImport)    
-    lot.df_data = lot.df_data.set_index('Date')
-    lot.df_data = lot.df_data.sort_index()
+    # create pandas DataFrame with lottery history; stored as compact arrays
+    df_data = pd.DataFrame(dictDataImport)    
+    df_data = df_data.set_index('Date')
+    lot.df_data = df_data.sort_index()
 
     dbg.debug_output(f"lot={lot}")
 
     return lot
     
+def lotteryInfo(name):
+    """
+    Returns
+    -------
+    LOTTERY_INFO entry of game name (first game if not found).
+
+    """
+    for i in range(len(LOTTERY_INFO)):
+        if name == LOTTERY_INFO[i]['name']:
+            return LOTTERY_INFO[i]
+    return LOTTERY_INFO[0]
+
+def sourceVersion(chartOptions):
+    """
+    Parameters
+    ----------
+    chartOptions : Chart_Options with selected lottery name and data source.
+
+    Returns
+    -------
+    tuple of (path, size, modification time) of the files the data source
+    reads; changes when any of them changes.  Internet data has no version
+    (cached until refreshed).
+
+    """
+    info = lotteryInfo(chartOptions.name)
+    source = chartOptions.dataSource
+    if source == 'Local':
+        paths = [info['path local']]
+    elif source == 'Database':
+        paths = [chartOptions.dbPath]
+    elif source == 'Directory':
+        paths = lingest.expandSources(info['path glob'])
+    else:
+        return ()
+    version = []
+    for path in paths:
+        if os.path.isfile(path):
+            st = os.stat(path)
+            version.append((path, st.st_size, st.st_mtime_ns))
+    return tuple(version)
+
+@lmem.profiled('load')
+def loadLotteryData(chartOptions):
+    """
+    Parameters
+    ----------
+    chartOptions : Chart_Options with selected lottery name, data source and
+                   save option.
+
+    Returns
+    -------
+    Lottery with draw history loaded.
+
+    """
+    dbg.debug_output("loadLotteryData()", color_fg='white', color_bg='black')
+    # select lottery game        
+    lot = Lottery(lotteryInfo(chartOptions.name))
+
+    # select source for lot.df_data
+    source = chartOptions.dataSource
+    
+    # database holds all games; first use imports the local file
+    if source == 'Database':
+        db = ldb.LotteryDatabase(chartOptions.dbPath)
+        if db.count(lot.info['name']) == 0:
+            if not os.path.isfile(lot.info['path local']):
+                db.close()
+                print(f"Local file {lot.info['path local']} not found.  Exiting application.")
+                sys.exit(1)
+            db.import_csv(lot.info['name'], lot.info['path local'])
+        lot.df_data = db.get_all(lot.info['name'])
+        # kept open for date lookups until lot.close()
+        lot.db = db
+        return lot
+    
+    # all files matching 'path glob' (mirrored exports), parsed in parallel
+    if source == 'Directory':
+        lot.store = lingest.readDrawSources(lot.info['path glob'], lot.info, chartOptions.ingest_workers, 
+                                            chartOptions.ingest_cache_dir, max(chartOptions.ingest_chunk_size, 1))
+        if len(lot.store) == 0:
+            print(f"No files found for {lot.info['path glob']}.  Exiting application.")
+            sys.exit(1)
+        return lot
+    
+    # check if local file exists
+    sourceFile = lot.info['path local']
+    if source == 'Local':
+        if not os.path.isfile(lot.info['path local']):
+            print(f"Local file {lot.info['path local']} not found.  Exiting application.")
+            sys.exit(1)
+    elif source == 'Internet':
+        sourceFile = lot.info['path internet']
+    else:
+        print(f"Source {source} not found, must be 'Internet', 'Local', 'Database' or 'Directory'.  Exiting application.")
+        sys.exit(2)
+    
+    # streaming ingest into compact arrays
+    # note:  saving downloaded data needs the whole table, read below
+    if chartOptions.ingest_chunk_size > 0 and not (source == 'Internet' and chartOptions.saveData):
+        try:
+            with lmem.phase('load: ingest'):
+                lot.store = lingest.readDrawsChunked(sourceFile, lot.info, chartOptions.ingest_chunk_size)
+        except:
+            sys.exit(3)
+        return lot
+           
+    # import data
+    try:
+        with lmem.phase('load: read_csv'):
+            # note:  URL downloaded once for header check and parsing
+            csv_source = lingest.fetchSource(sourceFile)
+            df_import = pd.read_csv(csv_source, header=0 if lingest.hasHeader(csv_source) else None, names=lingest.CSV_COLUMN_NAMES)
+    except:
+        sys.exit(3)
+        
+    # if source is from internet, ask to save downloaded data
+    if source == 'Internet':
+        sourceFile = lot.info['path local']
+        # value from check box on form
+        shouldSave = chartOptions.saveData
+        if shouldSave:  
+            dir_ = sourceFile[:sourceFile.index("/")+1]
+            if not os.path.isdir(dir_):
+                    # need to make symbols folder and file
+                    # If exist_ok is False (the default), 
+                    # a FileExistsError is raised if the target directory 
+                    # already exists.
+                    Path(dir_).mkdir(parents=True, exist_ok=True)
+    
+            df_import.to_csv(f"{sourceFile}", index=False)  
+            print(f"Saved {sourceFile}")
+            
+    # imported column format: ['Game Name', 'Month', 'Day', 'Year', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special', 'Multiplier']
+    desired_column_names = ['Date', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special']
+    
+    with lmem.phase('load: parse rows'):
+        # parse and sort data
+        d = []
+        s_Num1 = []
+        s_Num2 = []
+        s_Num3 = []
+        s_Num4 = []
+        s_Num5 = []
+        s_Special = []
+    
+        for row in range(len(df_import)):
+            s_m = f"{df_import.iloc[row,1]}"
+            s_d = f"{df_import.iloc[row,2]}"
+            s_y = f"{df_import.iloc[row,3]}"
+            d.append(pd.Timestamp(year=int(s_y), month=int(s_m), day=int(s_d)))
+            s_Num1.append(int(f"{df_import.iloc[row,4]}"))
+            s_Num2.append(int(f"{df_import.iloc[row,5]}"))
+            s_Num3.append(int(f"{df_import.iloc[row,6]}"))
+            s_Num4.append(int(f"{df_import.iloc[row,7]}"))
+            s_Num5.append(int(f"{df_import.iloc[row,8]}"))
+            s_Special.append(int(f"{df_import.iloc[row,9]}"))
+        
+        # prepare dictionary
+        dictDataImport = {desired_column_names[0]: d,
+                          desired_column_names[1]: s_Num1,
+                          desired_column_names[2]: s_Num2,
+                          desired_column_names[3]: s_Num3,
+                          desired_column_names[4]: s_Num4,
+                          desired_column_names[5]: s_Num5,
+                          desired_column_names[6]: s_Special}
+
+    with lmem.phase('load: DataFrame'):
+        # create pandas DataFrame with lottery history; stored as compact arrays
+        df_data = pd.DataFrame(dictDataImport)    
+        df_data = df_data.set_index('Date')
+        lot.df_data = df_data.sort_index()
+
+    # refresh database with downloaded data (idempotent upsert)
+    if source == 'Internet' and chartOptions.saveData:
+        with ldb.LotteryDatabase(chartOptions.dbPath) as db:
+            db.upsert_dataframe(lot.info['name'], lot.df_data)
+
+    return lot
+    
 #############
 # CLASSES   #
 #############
@@ -197,15 +432,197 @@ class Lottery():
     def __init__(self, dict_info):
         dbg.debug_output("Lottery.__init__", color_fg='black', color_bg='magenta')
         self.info = dict_info
-        self.df_data = pd.DataFrame()
+        # draw history as compact arrays (draw_store.DrawStore)
+        self.store = DrawStore(dict_info)
+        # optional lottery_db.LotteryDatabase serving date lookups
+        self.db = None
+        # incremented when draws change in place (keys of cached chart frames)
+        self.version = 0
+        # (version, draw features, feature cumulative counts), built on first use
+        self.features = None
+        # (version, calendar codes), built on first use
+        self.calendar = None
+        # (version, rule era boundary rows), built on first use
+        self.eras = None
+
+    def close(self):
+        # release database connection; lookups then read the store
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    @property
+    def df_data(self):
+        # pandas adapter for code that still needs a DataFrame
+        return self.store.to_dataframe()
+
+    @df_data.setter
+    def df_data(self, df):
+        self.store = DrawStore.from_dataframe(self.info, df)
+
+    def get_range(self, startDate, endDate):
+        """
+        Parameters
+        ----------
+        startDate : first draw date (inclusive).
+        endDate : last draw date (inclusive).
+
+        Returns
+        -------
+        DrawStore with draws between startDate and endDate 
+        (zero-copy view unless read from database).
+
+        """
+        if self.db is not None:
+            return DrawStore.from_dataframe(self.info, self.db.get_range(self.info['name'], startDate, endDate))
+        return self.store.slice(startDate, endDate)
+
+    def get_on_date(self, drawDate):
+        """
+        Returns
+        -------
+        DrawStore with the draw on drawDate (0 or 1 rows).
+
+        """
+        return self.get_range(drawDate, drawDate)
+    
+    def draw_features(self):
+        """
+        Returns
+        -------
+        (features, cums):  per draw features (lottery_analysis.drawFeatures)
+        and their cumulative histograms, computed once per data version.
+
+        """
+        if self.features is None or self.features[0] != self.version:
+            features = la.drawFeatures(self.store)
+            self.features = (self.version, features, la.featureCumulativeCounts(features))
+        return self.features[1], self.features[2]
+    
+    def calendar_codes(self):
+        """
+        Returns
+        -------
+        calendar bucket codes and labels of draws
+        (lottery_analysis.calendarCodes), computed once per data version.
+
+        """
+        if self.calendar is None or self.calendar[0] != self.version:
+            self.calendar = (self.version, la.calendarCodes(self.store))
+        return self.calendar[1]
+    
+    def era_bounds(self):
+        """
+        Returns
+        -------
+        boundary rows of rule eras of draws (lottery_analysis.eraIndex),
+        computed once per data version.
+
+        """
+        if self.eras is None or self.eras[0] != self.version:
+            self.eras = (self.version, la.eraIndex(self.store))
+        return self.eras[1]
+    
+    def append_draws(self, balls, days):
+        """
+        Add new draws (e.g. rows appended to the local file) in place.
+
+        Returns
+        -------
+        number of draws added.
+
+        """
+        n_added = self.store.extend(balls, days)
+        if n_added:
+            self.version += 1
+        return n_added
             
-class Balls_Text():
+class Frame_Cache():
+    """
+    LRU cache of rendered chart frames (canvas regions from copy_from_bbox)
+    with a memory cap; least recently shown frames are evicted first.
+    """
+    def __init__(self, max_bytes):
+        dbg.debug_output(f"Frame_Cache.__init__({max_bytes})", color_fg='white', color_bg='blue')
+        self.max_bytes = max_bytes
+        # key -> (region, nbytes), least recently used first
+        self.frames = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+    def __repr__(self):
+        return f"Frame_Cache({len(self.frames)} frames, {self.nbytes:,d} of {self.max_bytes:,d} bytes, {self.hits} hits, {self.misses} misses, {self.evictions} evicted)"
+        
+    def get(self, key):
+        if key not in self.frames:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.frames.move_to_end(key)
+        return self.frames[key][0]
+    
+    def put(self, key, region, nbytes):
+        if nbytes > self.max_bytes:
+            return
+        if key in self.frames:
+            self.nbytes -= self.frames.pop(key)[1]
+        self.frames[key] = (region, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            (_, (_, n)) = self.frames.popitem(last=False)
+            self.nbytes -= n
+            self.evictions += 1
+            
+    def clear(self):
+        self.frames.clear()
+        self.nbytes = 0
+
+class Dataset_Cache():
+    """
+    Loaded games of this session, keyed by (game, data source) and valid
+    while the version of the source files (sourceVersion()) is unchanged.
+    """
     def __init__(self):
-        dbg.debug_output("Balls_Text.__init__", color_fg='white', color_bg='blue')
-        self.ax00 = []
-        self.ax01 = []
-        self.ax10 = []
-        self.ax11 = []
+        dbg.debug_output("Dataset_Cache.__init__", color_fg='white', color_bg='blue')
+        # (name, source) -> (version, Lottery)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        
+    def __repr__(self):
+        return f"Dataset_Cache({len(self.entries)} games, {self.hits} hits, {self.misses} misses)"
+        
+    def load(self, chartOptions):
+        """
+        Returns
+        -------
+        Lottery of selected game and source; loaded by loadLotteryData()
+        unless cached with the current source version.
+
+        """
+        key = (chartOptions.name, chartOptions.dataSource)
+        version = sourceVersion(chartOptions)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            dbg.debug_output(f"Dataset_Cache.load{key}:  cached, {self}", color_fg='white', color_bg='blue')
+            return entry[1]
+        self.misses += 1
+        if entry is not None:
+            # outdated:  release its database connection
+            entry[1].close()
+        lot = loadLotteryData(chartOptions)
+        # note:  saving internet data changes the local file:  take version after loading
+        self.entries[key] = (sourceVersion(chartOptions), lot)
+        dbg.debug_output(f"Dataset_Cache.load{key}:  loaded, {self}", color_fg='white', color_bg='blue')
+        return lot
+    
+    def invalidate(self, name, source=None):
+        # drop cached game (all sources if source is None)
+        for key in [k for k in self.entries if k[0] == name and (source is None or k[1] == source)]:
+            self.entries.pop(key)[1].close()
 
 class Chart_Options():
     def __init__(self):
@@ -213,9 +630,39 @@ class Chart_Options():
         self.name = ""
         self.dataSource = 'Local'
         self.saveData = True
+        self.dbPath = ldb.DB_PATH_DEFAULT
+        # rows per chunk of streaming ingest (0 = read whole file with pandas)
+        self.ingest_chunk_size = lingest.INGEST_CHUNK_SIZE
+        # 'Directory' source:  worker processes (None = number of CPUs) and cache of parsed files
+        self.ingest_workers = None
+        self.ingest_cache_dir = lingest.INGEST_CACHE_DIR
         self.chart_histogram = True
         self.chart_sorted_histogram = True
         self.chart_ball_date_scatter = True
+        self.chart_rolling_frequency = False
+        # number of draws N in rolling frequency window
+        self.rolling_window = 50
+        # draw feature histograms (sum, odd, high, spread, consecutive)
+        self.chart_draw_features = False
+        # ball histograms per calendar bucket ('' = none, 'weekday', 'month' or 'year')
+        self.calendar_bucket = ''
+        # histograms show share of draws each ball was eligible for (in the pool
+        # under the rules of each draw) instead of times drawn
+        self.normalized_histogram = False
+        # playback through draw dates:  frames per second and fixed range
+        # slider window in draws moving with the slider (0 = range not moved)
+        self.playback_fps = 10
+        self.playback_window = 0
+        # memory cap of cache of rendered chart frames in MB (0 = no cache)
+        self.frame_cache_mb = 0
+        # hot/cold streak list:  minimum draws per range, ranges listed and worker processes
+        self.chart_hot_streaks = False
+        self.streak_min_draws = lscan.SCAN_MIN_DRAWS
+        self.streak_top_k = lscan.SCAN_TOP_K
+        self.streak_workers = 1
+        # follow local file and add appended draws to open charts (poll interval in ms)
+        self.watch_file = False
+        self.watch_interval_ms = 2000
     
 class windows(tk.Tk):
        
@@ -226,9 +673,11 @@ class windows(tk.Tk):
                 
         # Adding a title to the window
         self.wm_title(f"{APP_NAME} v{APP_VERSION}")
-        self.geometry('250x300') 
+        self.geometry('250x640') 
         
         self.chartOptions = Chart_Options()
+        # games loaded in this session
+        self.datasetCache = Dataset_Cache()
         
         # create frame and assign it to container
         container = tk.Frame(self, height=800, width=800)
@@ -262,13 +711,26 @@ class MainPage(tk.Frame):
         dbg.debug_output("MainPage().__init__", color_fg='green')
         tk.Frame.__init__(self, parent)
         self.controller = controller
+        # charts last drawn (figure reused by the next Draw Charts)
+        self.ch = None
         self.show()
         
-    def update_var(self, event):
+    def update_var(self, event=None):
         dbg.debug_output("update_var()", color_fg='green')
         self.controller.chartOptions.name = self.lot_name.get()
         self.controller.chartOptions.dataSource = self.source.get()
         self.controller.chartOptions.saveData = self.saveFile.get()
+        self.controller.chartOptions.chart_rolling_frequency = bool(self.chartRolling.get())
+        self.controller.chartOptions.rolling_window = int(self.rollingWindow.get())
+        self.controller.chartOptions.chart_draw_features = bool(self.chartFeatures.get())
+        self.controller.chartOptions.calendar_bucket = self.calendarBucket.get().lower() if self.calendarBucket.get() != 'None' else ''
+        self.controller.chartOptions.normalized_histogram = bool(self.normalizedHistogram.get())
+        self.controller.chartOptions.playback_fps = int(self.playbackFps.get())
+        self.controller.chartOptions.playback_window = int(self.playbackWindow.get())
+        self.controller.chartOptions.frame_cache_mb = int(self.frameCacheMB.get())
+        self.controller.chartOptions.chart_hot_streaks = bool(self.chartStreaks.get())
+        self.controller.chartOptions.streak_min_draws = int(self.streakMinDraws.get())
+        self.controller.chartOptions.watch_file = bool(self.watchFile.get())
         dbg.debug_output(f"update_var:  chartOptions = {self.controller.chartOptions}", color_fg='green')
         
     def show(self):
@@ -292,7 +754,7 @@ class MainPage(tk.Frame):
         labels.append(label)
 
         # Add data source combobox 
-        self.dataSources = ['Local', 'Internet']
+        self.dataSources = ['Local', 'Internet', 'Database', 'Directory']
         self.source = tk.StringVar(self) 
         self.cboDataSources = ttk.Combobox(self, width=27, textvariable=self.source, values=self.dataSources, exportselection=False) 
         self.cboDataSources.current(0)  
@@ -311,120 +773,125 @@ class MainPage(tk.Frame):
         
         # to do:  Add check boxes for chart types
         
-        # add button to draw charts
-        button_DrawCharts = tk.Button(self, text="Draw Charts", command=self.draw_charts)
-        button_DrawCharts.pack(padx=10, pady=10)
+        # add check box and window size for rolling frequency chart
+        self.chartRolling = tk.IntVar(self, value=int(self.controller.chartOptions.chart_rolling_frequency))
+        self.chkChartRolling = tk.Checkbutton(self, text="Rolling frequency, window N draws:", variable=self.chartRolling, command=self.update_var)
+        self.chkChartRolling.pack(padx=10, fill="x")
+        self.rollingWindow = tk.IntVar(self, value=self.controller.chartOptions.rolling_window)
+        self.spnRollingWindow = tk.Spinbox(self, from_=2, to=1000, width=6, textvariable=self.rollingWindow, command=self.update_var)
+        self.spnRollingWindow.pack(padx=10, pady=5)
         
-    def inputLotteryData(self):
-        dbg.debug_output("MainPage.inputLotteryData()", color_fg='green')
-        # select lottery game        
-        lot = Lottery
-        idx = 0
-        for i in range(len(LOTTERY_INFO)):
-            if self.controller.chartOptions.name == LOTTERY_INFO[i]['name']:
-                idx = i
-                break
-        lot.info = LOTTERY_INFO[idx]
-
-        # select source for lot.df_data
-        source = self.controller.chartOptions.dataSource
-        
-        # check if local file exists
-        sourceFile = lot.info['path local']
-        if source == 'Local':
-            if not os.path.isfile(lot.info['path local']):
-                print(f"Local file {lot.info['path local']} not found.  Exiting application.")
-                sys.exit(1)
-        elif source == 'Internet':
-            sourceFile = lot.info['path internet']
-        else:
-            print(f"Source {source} not found, must be 'Internet' or 'Local'.  Exiting application.")
-            sys.exit(2)
-               
-        # import data
-        try:
-            df_import = pd.read_csv(sourceFile)
-        except:
-            sys.exit(3)
-            
-        # if source is from internet, ask to save downloaded data
-        if source == 'Internet':
-            sourceFile = lot.info['path local']
-            # value from check box on form
-            shouldSave = self.controller.chartOptions.saveData
-            if shouldSave:  
-                dir_ = sourceFile[:sourceFile.index("/")+1]
-                if not os.path.isdir(dir_):
-                        # need to make symbols folder and file
-                        # If exist_ok is False (the default), 
-                        # a FileExistsError is raised if the target directory 
-                        # already exists.
-                        Path(dir_).mkdir(parents=True, exist_ok=True)
-        
-                df_import.to_csv(f"{sourceFile}", index=False)  
-                print(f"Saved {sourceFile}")
-                
-        # imported column format: ['Game Name', 'Month', 'Day', 'Year', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special', 'Multiplier']
-        desired_column_names = ['Date', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special']
+        # add check box for histograms normalized by draws eligible under rule eras
+        self.normalizedHistogram = tk.IntVar(self, value=int(self.controller.chartOptions.normalized_histogram))
+        tk.Checkbutton(self, text="Normalize by draws eligible (rule eras)", variable=self.normalizedHistogram, command=self.update_var).pack(padx=10, fill="x")
         
-        # parse and sort data
-        d = []
-        s_Num1 = []
-        s_Num2 = []
-        s_Num3 = []
-        s_Num4 = []
-        s_Num5 = []
-        s_Special = []
+        # add check box for draw feature histograms
+        self.chartFeatures = tk.IntVar(self, value=int(self.controller.chartOptions.chart_draw_features))
+        tk.Checkbutton(self, text="Draw features (sum, odd, high, ...)", variable=self.chartFeatures, command=self.update_var).pack(padx=10, fill="x")
         
-        for row in range(len(df_import)):
-            s_m = f"{df_import.iloc[row,1]}"
-            s_d = f"{df_import.iloc[row,2]}"
-            s_y = f"{df_import.iloc[row,3]}"
-            d.append(pd.Timestamp(year=int(s_y), month=int(s_m), day=int(s_d)))
-            s_Num1.append(int(f"{df_import.iloc[row,4]}"))
-            s_Num2.append(int(f"{df_import.iloc[row,5]}"))
-            s_Num3.append(int(f"{df_import.iloc[row,6]}"))
-            s_Num4.append(int(f"{df_import.iloc[row,7]}"))
-            s_Num5.append(int(f"{df_import.iloc[row,8]}"))
-            s_Special.append(int(f"{df_import.iloc[row,9]}"))
-            
-        # prepare dictionary
-        dictDataImport = {desired_column_names[0]: d,
-                          desired_column_names[1]: s_Num1,
-                          desired_column_names[2]: s_Num2,
-                          desired_column_names[3]: s_Num3,
-                          desired_column_names[4]: s_Num4,
-                          desired_column_names[5]: s_Num5,
-                          desired_column_names[6]: s_Special}
+        # add calendar bucket of ball histograms per weekday, month or year
+        frmCalendar = tk.Frame(self)
+        tk.Label(frmCalendar, text="Histograms per:").pack(side="left")
+        self.calendarBucket = tk.StringVar(self)
+        cboCalendar = ttk.Combobox(frmCalendar, width=9, textvariable=self.calendarBucket, values=['None', 'Weekday', 'Month', 'Year'], exportselection=False)
+        cboCalendar.current(0)
+        cboCalendar.bind("<<ComboboxSelected>>", self.update_var)
+        cboCalendar.pack(side="left")
+        frmCalendar.pack(padx=10, pady=5)
         
-        # create pandas DataFrame with lottery history
-        lot.df_data = pd.DataFrame(dictDataImport)    
-        lot.df_data = lot.df_data.set_index('Date')
-        lot.df_data = lot.df_data.sort_index()
-
-        return lot
+        # add check box and minimum range size for hot/cold streak list
+        frmStreaks = tk.Frame(self)
+        self.chartStreaks = tk.IntVar(self, value=int(self.controller.chartOptions.chart_hot_streaks))
+        tk.Checkbutton(frmStreaks, text="Hot streaks, min draws:", variable=self.chartStreaks, command=self.update_var).pack(side="left")
+        self.streakMinDraws = tk.IntVar(self, value=self.controller.chartOptions.streak_min_draws)
+        tk.Spinbox(frmStreaks, from_=2, to=5000, width=5, textvariable=self.streakMinDraws, command=self.update_var).pack(side="left")
+        frmStreaks.pack(padx=10, pady=5)
+        
+        # add playback frames per second and range window size (0 = fixed range)
+        frmPlayback = tk.Frame(self)
+        tk.Label(frmPlayback, text="Playback fps:").pack(side="left")
+        self.playbackFps = tk.IntVar(self, value=self.controller.chartOptions.playback_fps)
+        tk.Spinbox(frmPlayback, from_=1, to=60, width=3, textvariable=self.playbackFps, command=self.update_var).pack(side="left")
+        tk.Label(frmPlayback, text=" window:").pack(side="left")
+        self.playbackWindow = tk.IntVar(self, value=self.controller.chartOptions.playback_window)
+        tk.Spinbox(frmPlayback, from_=0, to=5000, width=5, textvariable=self.playbackWindow, command=self.update_var).pack(side="left")
+        frmPlayback.pack(padx=10, pady=5)
+        
+        # add memory cap of cache of rendered chart frames (0 = no cache)
+        frmFrameCache = tk.Frame(self)
+        tk.Label(frmFrameCache, text="Frame cache MB (0 = off):").pack(side="left")
+        self.frameCacheMB = tk.IntVar(self, value=self.controller.chartOptions.frame_cache_mb)
+        tk.Spinbox(frmFrameCache, from_=0, to=4096, width=5, textvariable=self.frameCacheMB, command=self.update_var).pack(side="left")
+        frmFrameCache.pack(padx=10, pady=5)
+        
+        # add check box to follow local file for new draws
+        self.watchFile = tk.IntVar(self, value=int(self.controller.chartOptions.watch_file))
+        tk.Checkbutton(self, text="Watch local file for new draws", variable=self.watchFile, command=self.update_var).pack(padx=10, fill="x")
+        
+        # add buttons to draw charts and to reload data of selected game and source
+        frmButtons = tk.Frame(self)
+        tk.Button(frmButtons, text="Draw Charts", command=self.draw_charts).pack(side="left", padx=5)
+        tk.Button(frmButtons, text="Refresh Data", command=self.refresh_data).pack(side="left", padx=5)
+        frmButtons.pack(padx=10, pady=10)
+        
+    def inputLotteryData(self):
+        dbg.debug_output("MainPage.inputLotteryData()", color_fg='green')
+        return self.controller.datasetCache.load(self.controller.chartOptions)
+    
+    def refresh_data(self):
+        dbg.debug_output("MainPage.refresh_data()", color_fg='green')
+        self.update_var()
+        self.controller.datasetCache.invalidate(self.controller.chartOptions.name, self.controller.chartOptions.dataSource)
+        self.draw_charts()
 
     def draw_charts(self):
         dbg.debug_output("MainPage.draw_charts()", color_fg='green')
 
+        # read current values of all inputs
+        self.update_var()
+        
         lot = self.inputLotteryData()
         
         dbg.debug_output(f"MainPage.draw_charts:  lot={lot}", color_fg='green')
         
-        # create charts
-        self.ch = LotterySummaryCharts(lot)
+        # create charts; previous charts give up the figure and stop watching
+        if self.ch is not None:
+            self.ch.stop_watch()
+        self.ch = LotterySummaryCharts(lot, self.controller.chartOptions)
 
 class LotterySummaryCharts():
     
-    def __init__(self, lottery):
+    def __init__(self, lottery, chartOptions=None):
         dbg.debug_output("LotterySummaryCharts.__init__()", color_fg='blue', color_bg='white', style='bright')
 
         self.lottery = lottery
-        # add lists for text boxes for balls drawn on selected date (slider)
-        self.balls_text = Balls_Text()
+        self.chartOptions = chartOptions if chartOptions is not None else Chart_Options()
+        # rows i0 to i1-1 of lottery.store selected by range slider
+        self.range_rows = (0, len(self.lottery.store))
+        # marker collections of balls drawn on selected date (slider) [[ax00, ax01], [ax10, ax11]],
+        # ball -> x position on each axes and label paths by ball, background for blitting markers
+        self.ball_markers = [[None, None], [None, None]]
+        self.ball_x = [[np.full(256, np.nan), np.full(256, np.nan)], [np.full(256, np.nan), np.full(256, np.nan)]]
+        self.marker_labels = {}
+        self.marker_background = None
+        # bar patches of histograms [[ax00, ax01], [ax10, ax11]]
+        self.hist_patches = [[[], []], [[], []]]
+        # cumulative ball counts (main, special), built on first use
+        self.cum_counts = None
+        # playback timer (None when not playing) and row of next playback frame
+        self.anim = None
+        self.playback_idx = 0
+        # last navigation key, time pressed and current step multiplier (key repeat acceleration)
+        self.nav_key_last = None
+        self.nav_key_time = 0.0
+        self.nav_key_repeat = 1
+        # optional cache of rendered frames and range rows the axes were last drawn for
+        self.frame_cache = Frame_Cache(self.chartOptions.frame_cache_mb * 2**20) if self.chartOptions.frame_cache_mb > 0 else None
+        self.axes_range_rows = None
         self.create_charts()        
     
         
+    @lmem.profiled('create_charts')
     def create_charts(self):
         dbg.debug_output("LotterySummaryCharts.create_charts()", color_fg='blue', color_bg='white', style='bright')
 
@@ -434,22 +901,51 @@ class LotterySummaryCharts():
         self.fig.set_figwidth(10)
         self.fig.canvas.manager.set_window_title(self.lottery.info['name'])
         
+        # define values to use for slider value snapping
+        # note:  draw indices are the source of truth; slider_steps maps index -> slider value 
+        #        and step_index maps slider value -> index, both in constant time
+        self.slider_steps = list(mpl.dates.date2num(self.lottery.store.dates))
+        self.step_index = {v: i for i, v in enumerate(self.slider_steps)}
+        self.draw_idx = len(self.slider_steps) - 1
+        
         # set start and end dates as numbers for sliders
-        startDate = self.lottery.df_data.index[0]
-        numStartDate = mpl.dates.date2num(startDate)
-        endDate = self.lottery.df_data.index[-1]
-        numEndDate = mpl.dates.date2num(endDate)
+        numStartDate = self.slider_steps[0]
+        numEndDate = self.slider_steps[-1]
         
-        # define values to use for slider value snapping
-        self.slider_steps = [mpl.dates.date2num(d) for d in self.lottery.df_data.index]
+        # optional rolling frequency chart (separate figure)
+        if self.chartOptions.chart_rolling_frequency:
+            self.create_rolling_chart()
+        
+        # optional draw feature histograms (separate figure)
+        if self.chartOptions.chart_draw_features:
+            self.create_features_chart()
+        
+        # optional ball histograms per calendar bucket (separate figure)
+        if self.chartOptions.calendar_bucket:
+            self.create_calendar_chart()
+        
+        # optional list of hot/cold streaks (separate figure)
+        if self.chartOptions.chart_hot_streaks:
+            self.create_streaks_chart()
         
         # add RangeSlider to select which dates from df_data are shown
         self.ax_r_slider = self.fig.add_axes([0.1, 0.925, 0.2, 0.03])
-        self.r_slider = RangeSlider(self.ax_r_slider, "Date Range\n⌘(↑↓/←→)", numStartDate, numEndDate, valinit=(numStartDate, numEndDate), color='b', track_color='c', valstep=self.slider_steps)
+        self.r_slider = RangeSlider(self.ax_r_slider, "Date Range\n⌘(↑↓/←→)", numStartDate, numEndDate, valinit=(numStartDate, numEndDate), color='b', track_color='c', valstep=np.array(self.slider_steps))
         
         # add Slider to select individual date
         self.ax_slider = self.fig.add_axes([0.7, 0.925, 0.2, 0.03])
-        self.slider = Slider(self.ax_slider, "Draw Date\n(←→)", numStartDate, numEndDate, valinit=numEndDate, color='b', track_color='c', valstep=self.slider_steps)
+        self.slider = Slider(self.ax_slider, "Draw Date\n(←→)", numStartDate, numEndDate, valinit=numEndDate, color='b', track_color='c', valstep=np.array(self.slider_steps))
+        
+        # Draw Date slider and ball markers are blitted on date changes (update_slider), 
+        # and drawn after each full redraw (on_draw)
+        self.slider.drawon = False
+        self.animate_dynamic_artists()
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+        
+        # add Button to play/pause stepping through draw dates
+        self.ax_play = self.fig.add_axes([0.46, 0.925, 0.08, 0.04])
+        self.btn_play = Button(self.ax_play, "Play")
+        self.btn_play.on_clicked(self.toggle_playback)
                 
         # show initial charts
         # note:  update range slider first to draw chart
@@ -459,27 +955,42 @@ class LotterySummaryCharts():
         # Event Handlers
         
         # update charts on slider change with selected dates
-        self.r_slider.on_changed(self.update_range_slider)
-        self.slider.on_changed(self.update_slider)
+        self.r_slider.on_changed(self.on_range_slider_changed)
+        self.slider.on_changed(self.on_slider_changed)
         
-        # listen for key press events (allows increasing or decreasing slider or r_slider using cmd, up/down or left/right arrow keys)
+        if self.frame_cache is not None:
+            # frames are drawn or blitted by on_*_changed, not by slider idle redraws
+            self.r_slider.drawon = False
+            self.slider.drawon = False
+            # cached frames are only valid for current canvas size
+            self.fig.canvas.mpl_connect('resize_event', lambda event: self.frame_cache.clear())
+        
+        # listen for key press events (allows increasing or decreasing slider or r_slider using cmd, up/down or left/right arrow keys; space = play/pause)
         self.cid = self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+        
+        # optional polling of local file for appended draws
+        self.watch_tail = None
+        self.watch_timer = None
+        if self.chartOptions.watch_file:
+            self.start_watch()
                 
+    @lmem.profiled('update_charts')
     def update_charts(self, startDate, endDate):
         dbg.debug_output("LotterySummaryCharts.update_charts()", color_fg='blue', color_bg='white', style='bright')
+        self.axes_range_rows = tuple(self.range_rows)
             
         # clear the axes
         for a, b in self.ax:
             a.cla()
             b.cla()
+        self.create_ball_markers()
                 
-        # create df_data_to_show between startDate and endDate        
-        df_data_to_show = self.lottery.df_data.loc[self.lottery.df_data.index >= startDate]
-        df_data_to_show = df_data_to_show.loc[df_data_to_show.index <= endDate]
+        # create data_to_show between startDate and endDate        
+        data_to_show = self.lottery.get_range(startDate, endDate)
         
-        # list of ball numbers
-        ball_numbers_picked = np.array([df_data_to_show.loc[row, col] for col in df_data_to_show.columns[0:5] for row in df_data_to_show.index])
-        special_numbers_picked = np.array([df_data_to_show.loc[row, df_data_to_show.columns[5]] for row in df_data_to_show.index])
+        # list of ball numbers (Num1 column first, then Num2, ...)
+        ball_numbers_picked = data_to_show.balls.T.ravel()
+        special_numbers_picked = data_to_show.special
                 
         # histogram (using numpy)
         n_bins = self.lottery.info['balls range']
@@ -500,6 +1011,10 @@ class LotterySummaryCharts():
         special_numbers_hist_sorted.append(special_numbers_hist[0][idx_sorted])
         special_numbers_hist_sorted.append(special_numbers_hist[1][idx_sorted])
         s_special_numbers_hist_sorted = [f"{int(b)}" for b in special_numbers_hist_sorted[1]]
+        
+        # ball -> x position of markers on sorted histograms
+        self.set_sorted_x(0, np.argsort(ball_numbers_hist[0])[::-1])
+        self.set_sorted_x(1, idx_sorted)
             
         self.ax[0][0].tick_params(axis='x', labelrotation=90, labelsize=6)
         self.ax[0][1].tick_params(axis='x', labelrotation=90, labelsize=6)
@@ -509,22 +1024,26 @@ class LotterySummaryCharts():
         ball_counts, bins, patches = self.ax[0][0].hist(ball_numbers_picked, bins=n_bins, rwidth=0.5, align='left')
         # normalize color range to bar height
         colorPatches(ball_counts, patches)
+        self.hist_patches[0][0] = patches
         self.ax[0][0].set_title(f"Ball Numbers ({min(self.lottery.info['balls range'])} to {max(self.lottery.info['balls range'])-1})")
         self.ax[0][0].set_ylabel("# times drawn")
         
         ball_counts, bins, patches = self.ax[0][1].hist(special_numbers_picked, bins=n_bins_special, rwidth=0.5, align='left')
         # normalize color range to bar height
         colorPatches(ball_counts, patches)
+        self.hist_patches[0][1] = patches
         self.ax[0][1].set_title(f"Special Numbers ({min(self.lottery.info['special range'])} to {max(self.lottery.info['special range'])-1})")
         
         patches = self.ax[1][0].bar(s_ball_numbers_hist_sorted, height=ball_numbers_hist_sorted[0], width=0.5)
         # normalize color range to bar height
         colorPatches(ball_numbers_hist_sorted[0], patches)
+        self.hist_patches[1][0] = patches
         self.ax[1][0].set_ylabel("# times drawn")
         
         patches = self.ax[1][1].bar(s_special_numbers_hist_sorted, height=special_numbers_hist_sorted[0], width=0.5)
         # normalize color range to bar height
         colorPatches(special_numbers_hist_sorted[0], patches)
+        self.hist_patches[1][1] = patches
         
         # set x-tick locators to show labels for each tick
         self.ax[0][0].xaxis.set_major_locator(mpl.ticker.MultipleLocator(1))
@@ -538,6 +1057,14 @@ class LotterySummaryCharts():
         self.ax[1][0].set_xlim(-1, max(n_bins)-1)
         self.ax[1][1].set_xlim(-1, max(n_bins_special)-1)
         
+        if self.chartOptions.normalized_histogram:
+            # same bars, heights = share of eligible draws (per rule era)
+            self.update_bars(*self.axes_range_rows)
+            y_max = max(max(p.get_height() for p in self.hist_patches[0][k]) for k in range(2))
+            self.ax[0][0].set_ylim(0, y_max * 1.05 if y_max > 0 else 1)
+            self.ax[0][0].set_ylabel("share of eligible draws")
+            self.ax[1][0].set_ylabel("share of eligible draws")
+        
         # remove first and last x-tick labels for aesthetics
         labels_00 = self.ax[0][0].get_xticklabels()
         labels_00[0].set_text("")
@@ -554,12 +1081,78 @@ class LotterySummaryCharts():
         labels_01[-1].set_text("")
         self.ax[0][1].set_xticklabels(labels_01)
        
-        self.update_slider(self.slider.val)
+        self.update_slider(self.slider.val, blit=False)
         
         # draw charts
         plt.show()
         plt.pause(.05)
             
+    def frame_key(self, range_rows, draw_idx):
+        return (self.lottery.info['name'], self.lottery.version, tuple(range_rows), draw_idx)
+    
+    def show_cached_frame(self, key):
+        """
+        Blit cached frame of key to canvas.
+
+        Returns
+        -------
+        True if key was cached.
+
+        """
+        region = self.frame_cache.get(key)
+        dbg.debug_output(f"frame cache {'hit' if region is not None else 'miss'} {key}:  {self.frame_cache}", color_fg='blue', color_bg='white')
+        if region is None:
+            return False
+        self.fig.canvas.restore_region(region)
+        self.fig.canvas.blit(self.fig.bbox)
+        return True
+    
+    def cache_frame(self, key):
+        # keep copy of canvas as composited by the last full draw or blit
+        # note:  never drawn again only to fill the cache; skipped while the
+        #        figure waits for a redraw
+        if self.fig.stale or self.marker_background is None:
+            return
+        region = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self.frame_cache.put(key, region, int(self.fig.bbox.width) * int(self.fig.bbox.height) * 4)
+        
+    def on_range_slider_changed(self, val):
+        if self.frame_cache is None:
+            self.update_range_slider(val)
+            return
+        
+        # rows of new range; cached frame shows charts, markers and sliders for (rows, draw)
+        i0 = self.step_index.get(val[0])
+        i1 = self.step_index.get(val[1])
+        rows = (i0, i1 + 1) if i0 is not None and i1 is not None else None
+        key = self.frame_key(rows, self.draw_idx)
+        if rows is not None and self.show_cached_frame(key):
+            self.range_rows = rows
+            # keep slider text current for later full redraws
+            d1 = pd.Timestamp(mpl.dates.num2date(val[0], tz=None),  tz=None).tz_convert(tz=None)
+            d2 = pd.Timestamp(mpl.dates.num2date(val[1], tz=None),  tz=None).tz_convert(tz=None)
+            self.r_slider.valtext.set_text(f"{d1:%m/%d/%y} to {d2:%m/%d/%y}")
+            self.update_linked_charts()
+            return
+        self.update_range_slider(val)
+        self.cache_frame(self.frame_key(self.range_rows, self.draw_idx))
+        
+    def on_slider_changed(self, val):
+        if self.frame_cache is None:
+            self.update_slider(val)
+            return
+        
+        idx = self.step_index.get(val, self.draw_idx)
+        if self.show_cached_frame(self.frame_key(self.range_rows, idx)):
+            self.draw_idx = idx
+            return
+        if self.axes_range_rows != tuple(self.range_rows):
+            # axes still show a range blitted from cache:  redraw them for current range
+            self.update_range_slider(self.r_slider.val)
+        else:
+            self.update_slider(val)
+        self.cache_frame(self.frame_key(self.range_rows, self.draw_idx))
+        
     def update_range_slider(self, val):
         dbg.debug_output(f"LotterySummaryCharts.update_range_slider({val})", color_fg='blue', color_bg='white', style='bright')
         # convert new range slider val to date
@@ -569,23 +1162,220 @@ class LotterySummaryCharts():
         # update text
         self.r_slider.valtext.set_text(f"{d1:%m/%d/%y} to {d2:%m/%d/%y}")
         
-        self.update_charts(d1, d2)    
-
         # if slider value not within range sliders, change text color
+        # note:  before drawing charts, so the drawn frame can be cached
         (l, r) = val
         if l <= self.slider.val and self.slider.val <= r:
             self.slider.valtext.set_color('k')
         else:
             self.slider.valtext.set_color('r')
         
+        self.range_rows = self.lottery.store.row_range(d1, d2)
+        self.update_charts(d1, d2)    
+        self.update_linked_charts()
+        
         return
         
-    def update_slider(self, val):
+    @lmem.profiled('update_linked_charts')
+    def update_linked_charts(self):
+        # charts in other figures following the range slider
+        if self.chartOptions.chart_rolling_frequency:
+            self.update_rolling_chart()
+        if self.chartOptions.chart_draw_features:
+            self.update_features_chart()
+        if self.chartOptions.calendar_bucket:
+            self.update_calendar_chart()
+        
+    def create_rolling_chart(self):
+        dbg.debug_output("LotterySummaryCharts.create_rolling_chart()", color_fg='blue', color_bg='white', style='bright')
+        
+        # rolling counts of main balls (top) and special balls (bottom) vs draw date
+        self.fig_rolling, self.ax_rolling = plt.subplots(2, 1, sharex=True, gridspec_kw={'height_ratios': [max(self.lottery.info['balls range']), max(self.lottery.info['special range'])]}, num=2, clear=True)
+        self.fig_rolling.set_figheight(7)
+        self.fig_rolling.set_figwidth(10)
+        self.fig_rolling.subplots_adjust(bottom=0.15)
+        self.fig_rolling.canvas.manager.set_window_title(f"{self.lottery.info['name']} - Rolling Frequency")
+        
+        # cumulative counts computed once; any window is a difference of 2 rows
+        self.rolling_cum = self.cumulative_counts()
+        self.rolling_images = [None, None]
+        
+        # add Slider to select window size N
+        self.ax_rolling_slider = self.fig_rolling.add_axes([0.3, 0.03, 0.4, 0.03])
+        self.rolling_slider = Slider(self.ax_rolling_slider, "Window N draws", 2, min(1000, max(2, len(self.lottery.store))), valinit=min(self.chartOptions.rolling_window, len(self.lottery.store)), valstep=1, color='b', track_color='c')
+        self.rolling_slider.on_changed(self.update_rolling_window)
+        
+    def update_rolling_window(self, val):
+        dbg.debug_output(f"LotterySummaryCharts.update_rolling_window({val})", color_fg='blue', color_bg='white', style='bright')
+        self.chartOptions.rolling_window = int(val)
+        self.update_rolling_chart()
+        
+    def update_rolling_chart(self):
+        dbg.debug_output("LotterySummaryCharts.update_rolling_chart()", color_fg='blue', color_bg='white', style='bright')
+        
+        (i0, i1) = self.range_rows
+        if i1 <= i0:
+            return
+        N = self.chartOptions.rolling_window
+        x_start = self.slider_steps[i0]
+        x_end = self.slider_steps[i1 - 1]
+        titles = ["Ball Numbers", "Special Numbers"]
+        
+        for k in range(2):
+            # counts over window of N draws ending at each draw in range slider window
+            counts = la.rollingCounts(self.rolling_cum[k], N, i0, i1)
+            # rows = ball numbers (skip unused column 0), columns = draws
+            image = counts[:, 1:].T
+            n_balls = image.shape[0]
+            extent = (x_start, x_end, 0.5, n_balls + 0.5)
+            ax = self.ax_rolling[k]
+            if self.rolling_images[k] is None:
+                self.rolling_images[k] = ax.imshow(image, aspect='auto', origin='lower', interpolation='nearest', cmap=mpl.cm.jet, extent=extent)
+                ax.set_ylabel(titles[k])
+                ax.xaxis_date()
+            else:
+                self.rolling_images[k].set_data(image)
+                self.rolling_images[k].set_extent(extent)
+            self.rolling_images[k].set_clim(image.min(), image.max())
+            ax.set_xlim(x_start, x_end)
+            ax.set_ylim(0.5, n_balls + 0.5)
+        
+        self.ax_rolling[0].set_title(f"# times drawn in last {N} draws")
+        self.fig_rolling.canvas.draw_idle()
+        
+    def create_features_chart(self):
+        dbg.debug_output("LotterySummaryCharts.create_features_chart()", color_fg='blue', color_bg='white', style='bright')
+        
+        # one histogram per feature; bars created once, heights set per range
+        (_, cums) = self.lottery.draw_features()
+        self.fig_features, self.ax_features = plt.subplots(1, len(la.FEATURE_NAMES), sharey=True, gridspec_kw={'width_ratios': [c.shape[1] + 4 for c in cums]}, num=4, clear=True)
+        self.fig_features.set_figheight(3)
+        self.fig_features.set_figwidth(12)
+        self.fig_features.canvas.manager.set_window_title(f"{self.lottery.info['name']} - Draw Features")
+        self.feature_patches = []
+        for (f, ax) in enumerate(self.ax_features):
+            x = np.arange(cums[f].shape[1])
+            if f == 0:
+                # sum in bins of FEATURE_SUM_BIN:  bar at start of bin
+                x = x * la.FEATURE_SUM_BIN
+            self.feature_patches.append(ax.bar(x, np.zeros(len(x)), width=0.8 * (x[1] - x[0] if len(x) > 1 else 1), align='edge' if f == 0 else 'center'))
+            ax.set_title(la.FEATURE_NAMES[f], fontsize=9)
+            if len(x) <= 10:
+                ax.xaxis.set_major_locator(mpl.ticker.MultipleLocator(1))
+            ax.tick_params(axis='x', labelsize=7)
+        self.fig_features.tight_layout()
+        
+    def update_features_chart(self):
+        dbg.debug_output("LotterySummaryCharts.update_features_chart()", color_fg='blue', color_bg='white', style='bright')
+        
+        (i0, i1) = self.range_rows
+        (_, cums) = self.lottery.draw_features()
+        if any(len(c[0]) != len(p) for (c, p) in zip(cums, self.feature_patches)):
+            # draws added (watch mode) with new feature values
+            self.create_features_chart()
+        y_max = 1
+        for (f, cum) in enumerate(cums):
+            # histogram of range = difference of 2 rows
+            counts = cum[i1] - cum[i0]
+            for p, n in zip(self.feature_patches[f], counts):
+                p.set_height(n)
+            colorPatches(counts, self.feature_patches[f])
+            y_max = max(y_max, counts.max())
+        self.ax_features[0].set_ylim(0, y_max * 1.05)
+        self.ax_features[0].set_ylabel(f"# of {i1 - i0} draws")
+        self.fig_features.canvas.draw_idle()
+        
+    def create_calendar_chart(self):
+        dbg.debug_output(f"LotterySummaryCharts.create_calendar_chart({self.chartOptions.calendar_bucket})", color_fg='blue', color_bg='white', style='bright')
+        
+        # small multiples:  one ball histogram per bucket with draws in history
+        (codes, labels) = self.lottery.calendar_codes()[self.chartOptions.calendar_bucket]
+        self.calendar_groups = np.flatnonzero(np.bincount(codes, minlength=len(labels)))
+        n = max(1, len(self.calendar_groups))
+        n_cols = min(n, 4)
+        n_rows = -(-n // n_cols)
+        self.fig_calendar, axs = plt.subplots(n_rows, n_cols, sharex=True, sharey=True, squeeze=False, layout='constrained', num=5, clear=True)
+        self.fig_calendar.set_figheight(1.8 * n_rows + 0.8)
+        self.fig_calendar.set_figwidth(12)
+        self.fig_calendar.canvas.manager.set_window_title(f"{self.lottery.info['name']} - Ball Numbers per {self.chartOptions.calendar_bucket}")
+        self.ax_calendar = axs.ravel()
+        self.calendar_patches = []
+        x = np.arange(1, la.ballBins(self.lottery.info))
+        for (k, ax) in enumerate(self.ax_calendar):
+            if k >= len(self.calendar_groups):
+                ax.set_visible(False)
+                continue
+            self.calendar_patches.append(ax.bar(x, np.zeros(len(x)), width=0.6))
+            ax.tick_params(axis='both', labelsize=7)
+        self.fig_calendar.supylabel("# times drawn", fontsize=9)
+        
+    def update_calendar_chart(self):
+        dbg.debug_output("LotterySummaryCharts.update_calendar_chart()", color_fg='blue', color_bg='white', style='bright')
+        
+        (i0, i1) = self.range_rows
+        (codes, labels) = self.lottery.calendar_codes()[self.chartOptions.calendar_bucket]
+        if not np.array_equal(self.calendar_groups, np.flatnonzero(np.bincount(codes, minlength=len(labels)))):
+            # draws added (watch mode) in a new bucket
+            self.create_calendar_chart()
+        # counts of all buckets in one pass over range
+        (counts, draws) = la.groupedHistograms(self.lottery.store, codes, len(labels), i0, i1)
+        for (k, g) in enumerate(self.calendar_groups):
+            for p, n in zip(self.calendar_patches[k], counts[g]):
+                p.set_height(n)
+            colorPatches(counts[g], self.calendar_patches[k])
+            self.ax_calendar[k].set_title(f"{labels[g]} ({draws[g]} draws)", fontsize=8)
+        self.ax_calendar[0].set_ylim(0, max(1, counts.max()) * 1.05)
+        self.fig_calendar.canvas.draw_idle()
+        
+    def create_streaks_chart(self):
+        dbg.debug_output("LotterySummaryCharts.create_streaks_chart()", color_fg='blue', color_bg='white', style='bright')
+        
+        # top ranges of main and special balls together, by |z|
+        opts = self.chartOptions
+        self.streaks = sorted(lscan.scanHotStreaks(self.lottery.store, opts.streak_min_draws, opts.streak_top_k, special=False, workers=opts.streak_workers) +
+                              lscan.scanHotStreaks(self.lottery.store, opts.streak_min_draws, opts.streak_top_k, special=True, workers=opts.streak_workers),
+                              key=lambda r: -abs(r['z']))[:opts.streak_top_k]
+        
+        self.fig_streaks = plt.figure(num=3, clear=True, figsize=(9, 0.5 + 0.3 * max(1, len(self.streaks))))
+        self.fig_streaks.canvas.manager.set_window_title(f"{self.lottery.info['name']} - Hot Streaks")
+        ax = self.fig_streaks.add_axes([0, 0, 1, 1])
+        ax.set_axis_off()
+        ax.set_title(f"Ranges of ≥ {opts.streak_min_draws} draws with balls drawn most above (red) or below (blue) expectation; click to show", fontsize=9, y=0.98, va='top')
+        
+        # one clickable line per range
+        self.streak_texts = []
+        for (k, row) in enumerate(self.streaks):
+            text = ax.text(0.02, 1 - (k + 1.5) / (len(self.streaks) + 1.5), lscan.formatStreak(row), family='monospace', fontsize=9,
+                           color='r' if row['z'] > 0 else 'b', picker=True, transform=ax.transAxes)
+            self.streak_texts.append(text)
+        if not self.streaks:
+            ax.text(0.5, 0.5, "Not enough draws", ha='center', transform=ax.transAxes)
+        self.fig_streaks.canvas.mpl_connect('pick_event', self.on_pick_streak)
+        
+    def on_pick_streak(self, event):
+        if event.artist not in self.streak_texts:
+            return
+        row = self.streaks[self.streak_texts.index(event.artist)]
+        dbg.debug_output(f"LotterySummaryCharts.on_pick_streak({lscan.formatStreak(row)})", color_fg='blue', color_bg='white', style='bright')
+        # load range into charts; show last draw of range
+        self.set_range_rows(row['i0'], row['i1'])
+        self.set_draw_index(row['i1'] - 1)
+        
+    @lmem.profiled('update_slider')
+    def update_slider(self, val, blit=True):
+        """
+        Parameters
+        ----------
+        val : Draw Date slider value.
+        blit : True to redraw only slider and ball markers now; False when
+               the caller redraws the whole figure.
+
+        """
         dbg.debug_output(f"LotterySummaryCharts.update_slider({val})", color_fg='blue', color_bg='white', style='bright')
 
         # convert new slider val to date
         d1 = pd.Timestamp(mpl.dates.num2date(val, tz=None),  tz=None).tz_convert(tz=None)
-        d2 = d1 + pd.Timedelta('12:00:00')
+        self.draw_idx = self.step_index.get(val, self.draw_idx)
         
         # update text
         self.slider.valtext.set_text(f"{d1:%m/%d/%y}")
@@ -597,118 +1387,501 @@ class LotterySummaryCharts():
         else:
             self.slider.valtext.set_color('r')
 
-        # show balls drawn on this date as text
-        # create df_balls_drawn_at_slider
-        df_balls_drawn_at_slider = self.lottery.df_data.loc[self.lottery.df_data.index >= d1]
-        df_balls_drawn_at_slider = df_balls_drawn_at_slider.loc[df_balls_drawn_at_slider.index <= d2]
-            
-        # list of ball numbers
-        balls_drawn_at_slider = np.array([df_balls_drawn_at_slider.loc[row, col] for col in df_balls_drawn_at_slider.columns[0:5] for row in df_balls_drawn_at_slider.index])
-        special_ball_drawn_at_slider = np.array([df_balls_drawn_at_slider.loc[row, df_balls_drawn_at_slider.columns[5]] for row in df_balls_drawn_at_slider.index])
-        
-        # get axes y min, max
-        (y_min_ax00, y_max_ax00) = self.ax[0][0].get_ylim()
-        (y_min_ax01, y_max_ax01) = self.ax[0][1].get_ylim()
-        (y_min_ax10, y_max_ax10) = self.ax[1][0].get_ylim()
-        (y_min_ax11, y_max_ax11) = self.ax[1][1].get_ylim()
-      
-        # add lists for text boxes for balls drawn on selected date (slider)        
-        if len(self.balls_text.ax00) == 0:
-            self.balls_text.ax00 = []
-            self.balls_text.ax01 = []
-            self.balls_text.ax10 = []
-            self.balls_text.ax11 = []
-            
-            for i in range(5): 
-                self.balls_text.ax00.append(self.ax[0][0].text(x=10, y=5, s="", ha = 'center', color='black', fontsize=8, bbox={'boxstyle': 'circle,pad=0.2', 'facecolor': 'white', 'alpha': 0.6}))
-                self.balls_text.ax10.append(self.ax[1][0].text(x=10, y=5, s="", ha = 'center', color='black', fontsize=8, bbox={'boxstyle': 'circle,pad=0.2', 'facecolor': 'white', 'alpha': 0.6}))
+        # show balls drawn on this date as markers
+        self.update_ball_markers(self.lottery.get_on_date(d1))
+        if blit:
+            self.blit_dynamic_artists()
+        
+    def create_ball_markers(self):
+        """
+        Add one marker collection per histogram axes (circles, then number
+        labels, x in data and y in axes coordinates); called after the axes
+        are cleared.
+        """
+        for (r, k) in ((0, 0), (0, 1), (1, 0), (1, 1)):
+            n = len(MARKER_Y[k])
+            markers = PathCollection([], sizes=[MARKER_SIZE**2], offsets=np.full((2 * n, 2), np.nan),
+                                     transform=IdentityTransform(), offset_transform=self.ax[r][k].get_xaxis_transform(),
+                                     facecolors=[(1, 1, 1, 0.6)] * n + [(0, 0, 0, 1)] * n,
+                                     edgecolors=[(0, 0, 0, 1)] * n + [(0, 0, 0, 0)] * n,
+                                     linewidths=[0.8] * n + [0] * n, animated=True, zorder=3)
+            self.ax[r][k].add_collection(markers, autolim=False)
+            markers.set_clip_on(False)
+            self.ball_markers[r][k] = markers
+        
+        # histograms:  x = ball number; balls outside current ball range (earlier game rules) hidden
+        for k in range(2):
+            n_bins = la.ballBins(self.lottery.info, special=(k == 1))
+            self.ball_x[0][k][:] = np.nan
+            self.ball_x[0][k][1:n_bins] = np.arange(1, n_bins)
+    
+    def set_sorted_x(self, k, idx_sorted):
+        # ball idx_sorted[j] + 1 is bar j of sorted histogram k (0 = main, 1 = special)
+        self.ball_x[1][k][:] = np.nan
+        self.ball_x[1][k][np.asarray(idx_sorted) + 1] = np.arange(len(idx_sorted))
+    
+    def marker_label(self, ball):
+        # label path of ball number, built on first use
+        if ball not in self.marker_labels:
+            self.marker_labels[ball] = ballLabelPath(f"{ball}")
+        return self.marker_labels[ball]
+        
+    def update_ball_markers(self, draw_at_slider):
+        """
+        Parameters
+        ----------
+        draw_at_slider : DrawStore with the draw to show (1 row).
+
+        Returns
+        -------
+        list of marker collections changed.
+
+        """
+        if len(draw_at_slider) == 0:
+            return []
+        
+        # balls in order drawn (Num1 to Num5) and special ball
+        balls = [draw_at_slider.balls[0].astype(np.intp), draw_at_slider.special[:1].astype(np.intp)]
+        artists = []
+        for (r, k) in ((0, 0), (0, 1), (1, 0), (1, 1)):
+            xy = np.column_stack([self.ball_x[r][k][balls[k]], MARKER_Y[k]])
+            markers = self.ball_markers[r][k]
+            markers.set_offsets(np.concatenate([xy, xy]))
+            markers.set_paths([MARKER_CIRCLE] * len(balls[k]) + [self.marker_label(b) for b in balls[k]])
+            artists.append(markers)
+        return artists
+    
+    def dynamic_artists(self):
+        # artists changed by Draw Date slider moves (drawn animated)
+        markers = [m for row in self.ball_markers for m in row if m is not None]
+        return markers + list(self.ax_slider.patches) + list(self.ax_slider.lines) + [self.slider.valtext]
+    
+    def playback_artists(self):
+        # artists changed by playback frames (drawn animated while playing)
+        # note:  in drawing order, ball markers over bars
+        artists = []
+        if self.chartOptions.playback_window > 0:
+            artists += [p for row in self.hist_patches for P in row for p in P] + [self.ax[1][k].xaxis for k in range(2)]
+            artists += list(self.ax_r_slider.patches) + list(self.ax_r_slider.lines) + [self.r_slider.valtext]
+        return artists + self.dynamic_artists()
+    
+    def animate_dynamic_artists(self):
+        # exclude from full redraws; on_draw() draws them over the saved background
+        for a in self.dynamic_artists():
+            a.set_animated(True)
+    
+    def on_draw(self, event):
+        # after each full redraw:  keep background for blitting, then draw slider and markers
+        if self.ax_slider not in self.fig.axes:
+            # figure reused by newer charts
+            return
+        if event.canvas is self.fig.canvas and hasattr(event.canvas, 'copy_from_bbox'):
+            self.marker_background = event.canvas.copy_from_bbox(self.fig.bbox)
+        for a in (self.playback_artists() if self.anim is not None else self.dynamic_artists()):
+            a.draw(event.renderer)
+    
+    def blit_dynamic_artists(self):
+        """
+        Redraw only the Draw Date slider and ball markers:  restore the
+        background saved by on_draw() and blit the figure once (full redraw
+        if there is no background yet).
+        """
+        self.blit_artists(self.dynamic_artists())
+    
+    def blit_artists(self, artists):
+        # note:  whole figure blitted, slider date texts and sorted histogram
+        #        tick labels are drawn outside of their axes
+        canvas = self.fig.canvas
+        if self.marker_background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self.marker_background)
+        for a in artists:
+            self.fig.draw_artist(a)
+        canvas.blit(self.fig.bbox)
+    
+    def cumulative_counts(self):
+        """
+        Returns
+        -------
+        [main, special] cumulative count matrices of lottery.store
+        (lottery_analysis.cumulativeCounts), built once per chart.
+
+        """
+        if self.cum_counts is None:
+            self.cum_counts = [la.cumulativeCounts(self.lottery.store, special=False),
+                               la.cumulativeCounts(self.lottery.store, special=True)]
+        return self.cum_counts
+    
+    def bar_values(self, k, i0, i1):
+        """
+        Parameters
+        ----------
+        k : 0 for main balls, 1 for special balls.
+        i0, i1 : rows i0 to i1-1 (ints or arrays (K,)).
+
+        Returns
+        -------
+        array (..., balls) of bar heights:  times drawn, or share of eligible
+        draws (lottery_analysis.normalizedFrequency) in normalized mode.
+
+        """
+        cum = self.cumulative_counts()[k]
+        if self.chartOptions.normalized_histogram:
+            return la.normalizedFrequency(cum, self.lottery.info, self.lottery.era_bounds(), i0, i1, special=(k == 1))
+        # skip column 0 (balls outside current ball range)
+        return (cum[np.asarray(i1)] - cum[np.asarray(i0)])[..., 1:]
+    
+    def update_bars(self, i0, i1):
+        """
+        Update bar heights, colors and sorted labels in place for rows i0 to
+        i1-1 (no axes clearing; used by playback and normalized mode).
+
+        Returns
+        -------
+        list of artists changed.
+
+        """
+        artists = []
+        for k in range(2):
+            counts = self.bar_values(k, i0, i1)
+            for p, n in zip(self.hist_patches[0][k], counts):
+                p.set_height(n)
+            colorPatches(counts, self.hist_patches[0][k])
             
-            self.balls_text.ax01.append(self.ax[0][1].text(x=0, y=0, s="", ha = 'center', color='black', fontsize=8, bbox={'boxstyle': 'circle,pad=0.2', 'facecolor': 'white', 'alpha': 0.6}))
-            self.balls_text.ax11.append(self.ax[1][1].text(x=0, y=0, s="", ha = 'center', color='black', fontsize=8, bbox={'boxstyle': 'circle,pad=0.2', 'facecolor': 'white', 'alpha': 0.6}))
+            # sorted histogram:  same bars, new heights and ball labels
+            idx_sorted = np.argsort(counts)[::-1]
+            counts_sorted = counts[idx_sorted]
+            for p, n in zip(self.hist_patches[1][k], counts_sorted):
+                p.set_height(n)
+            colorPatches(counts_sorted, self.hist_patches[1][k])
+            self.ax[1][k].set_xticks(range(len(idx_sorted)), labels=[f"{b + 1}" for b in idx_sorted])
+            self.set_sorted_x(k, idx_sorted)
             
-        # update location of text boxes for normal balls
-        for i in range(len(balls_drawn_at_slider)): 
-            x = balls_drawn_at_slider[i]
-            y = y_min_ax00 + (i / len(balls_drawn_at_slider)) * (y_max_ax00 - y_min_ax00)
-            self.balls_text.ax00[i].set_position((x, y))
+            artists += list(self.hist_patches[0][k]) + list(self.hist_patches[1][k]) + [self.ax[1][k].xaxis]
+        return artists
+    
+    def set_slider_quiet(self, slider, val):
+        # set slider value without calling on_changed observers or redrawing canvas
+        (eventson, drawon) = (slider.eventson, slider.drawon)
+        slider.eventson = False
+        slider.drawon = False
+        slider.set_val(val)
+        (slider.eventson, slider.drawon) = (eventson, drawon)
+        
+    def toggle_playback(self, event=None):
+        dbg.debug_output("LotterySummaryCharts.toggle_playback()", color_fg='blue', color_bg='white', style='bright')
+        if self.anim is None:
+            self.start_playback()
+        else:
+            self.stop_playback()
             
-            # find x-location of ball on histogram
-            ticks = [t for t in self.ax[1][0].get_xticklabels() if t.get_text()==f"{balls_drawn_at_slider[i]}"]
-            (x,y) = ticks[0].get_position()
-            y = y_min_ax10 + (i / len(balls_drawn_at_slider)) * (y_max_ax10 - y_min_ax10)
-            self.balls_text.ax10[i].set_position((x, y))
-
-            # update text
-            self.balls_text.ax00[i].set_text(f"{balls_drawn_at_slider[i]}")
-            self.balls_text.ax10[i].set_text(f"{balls_drawn_at_slider[i]}")
-        
-        # update location of text box for special ball
-        ticks = [t for t in self.ax[0][1].get_xticklabels() if t.get_text()==f"{special_ball_drawn_at_slider[0]}"]
-        (x,y) = ticks[0].get_position()    
-        y = y_min_ax01 + (2 / len(balls_drawn_at_slider)) * (y_max_ax01 - y_min_ax01)
-        self.balls_text.ax01[0].set_position((x, y))
-        
-        # find x-location of special ball on histogram
-        ticks = [t for t in self.ax[1][1].get_xticklabels() if t.get_text()==f"{special_ball_drawn_at_slider[0]}"]
-        (x,y) = ticks[0].get_position()    
-        y = y_min_ax11 + (2 / len(balls_drawn_at_slider)) * (y_max_ax11 - y_min_ax11)
-        self.balls_text.ax11[0].set_position((x, y))
+    def prepare_playback(self, i_start):
+        """
+        Set slider (and range slider window) to row i_start and fix y limits
+        so frames only change bars, ball markers and slider artists.
+        """
+        window = self.chartOptions.playback_window
+        self.set_slider_quiet(self.slider, self.slider_steps[i_start])
+        self.draw_idx = i_start
+        if window > 0:
+            i0 = max(0, i_start - window + 1)
+            self.set_slider_quiet(self.r_slider, (self.slider_steps[i0], self.slider_steps[i_start]))
+        self.update_range_slider(self.r_slider.val)
+        
+        if window > 0:
+            # y limit = highest bar of any full window in history
+            i1 = np.arange(min(window, len(self.slider_steps)), len(self.slider_steps) + 1)
+            i0 = i1 - min(window, len(self.slider_steps))
+            y_max = max(self.bar_values(0, i0, i1).max(), self.bar_values(1, i0, i1).max())
+            self.ax[0][0].set_ylim(0, y_max * 1.05)
+        
+        # frame timing statistics
+        self.playback_frames = 0
+        self.playback_dropped = 0
+        self.playback_t_start = time.perf_counter()
+        self.playback_t_last = None
+        
+    def playback_step(self, idx):
+        """
+        Playback (and export) frame function; shows draw at row idx.
 
-        # update text
-        self.balls_text.ax01[0].set_text(f"{special_ball_drawn_at_slider[0]}")
-        self.balls_text.ax11[0].set_text(f"{special_ball_drawn_at_slider[0]}")
-        
-        # verify all balls_text objects in axes
-        for i in range(5):
-            if self.balls_text.ax00[i] not in self.ax[0][0].get_children():
-                self.ax[0][0].add_artist(self.balls_text.ax00[i])
-            if self.balls_text.ax10[i] not in self.ax[1][0].get_children():
-                self.ax[1][0].add_artist(self.balls_text.ax10[i])
-        if self.balls_text.ax01[0] not in self.ax[0][1].get_children():
-            self.ax[0][1].add_artist(self.balls_text.ax01[0])
-        if self.balls_text.ax11[0] not in self.ax[1][1].get_children():
-            self.ax[1][1].add_artist(self.balls_text.ax11[0])
-            
-        plt.show()
+        Returns
+        -------
+        list of artists changed.
+
+        """
+        # count frames that came later than scheduled
+        now = time.perf_counter()
+        interval = 1 / self.chartOptions.playback_fps
+        if self.playback_t_last is not None:
+            late = (now - self.playback_t_last) / interval
+            if late > 1.5:
+                self.playback_dropped += int(round(late)) - 1
+        self.playback_t_last = now
+        self.playback_frames += 1
+        
+        artists = []
+        window = self.chartOptions.playback_window
+        if window > 0:
+            i0 = max(0, idx - window + 1)
+            self.set_slider_quiet(self.r_slider, (self.slider_steps[i0], self.slider_steps[idx]))
+            self.r_slider.valtext.set_text(f"{mpl.dates.num2date(self.slider_steps[i0]):%m/%d/%y} to {mpl.dates.num2date(self.slider_steps[idx]):%m/%d/%y}")
+            self.range_rows = (i0, idx + 1)
+            artists += self.update_bars(i0, idx + 1)
+            artists += list(self.ax_r_slider.patches) + list(self.ax_r_slider.lines) + [self.r_slider.valtext]
+        
+        self.set_slider_quiet(self.slider, self.slider_steps[idx])
+        self.draw_idx = idx
+        self.slider.valtext.set_text(f"{mpl.dates.num2date(self.slider_steps[idx]):%m/%d/%y}")
+        (l, r) = self.r_slider.val
+        self.slider.valtext.set_color('k' if l <= self.slider.val <= r else 'r')
+        artists += list(self.ax_slider.patches) + list(self.ax_slider.lines) + [self.slider.valtext]
+        artists += self.update_ball_markers(self.lottery.store.rows(idx, idx + 1))
+        return artists
+    
+    def playback_tick(self):
+        # playback timer callback:  show next draw, blit, stop after last draw
+        if self.anim is None:
+            return
+        self.playback_step(self.playback_idx)
+        self.blit_artists(self.playback_artists())
+        self.playback_idx += 1
+        if self.playback_idx >= len(self.slider_steps):
+            self.stop_playback()
+    
+    def start_playback(self):
+        dbg.debug_output("LotterySummaryCharts.start_playback()", color_fg='blue', color_bg='white', style='bright')
+        i_start = self.draw_idx
+        if i_start >= len(self.slider_steps) - 1:
+            # at last draw:  start over from first draw in range
+            i_start = self.range_rows[0]
+        self.prepare_playback(i_start)
+        self.btn_play.label.set_text("Pause")
+        # note:  timer and blitting of the whole figure instead of FuncAnimation,
+        #        which blits only each artist's axes and leaves the slider date
+        #        texts and sorted histogram tick labels stale
+        self.playback_idx = i_start + 1
+        self.anim = self.fig.canvas.new_timer(interval=int(1000 / self.chartOptions.playback_fps))
+        self.anim.add_callback(self.playback_tick)
+        for a in self.playback_artists():
+            a.set_animated(True)
+        # full redraw saves background without playback artists (on_draw)
+        self.fig.canvas.draw()
+        self.anim.start()
+        
+    def stop_playback(self):
+        if self.anim is None:
+            return
+        dbg.debug_output("LotterySummaryCharts.stop_playback()", color_fg='blue', color_bg='white', style='bright')
+        self.anim.stop()
+        self.anim = None
+        for a in self.playback_artists():
+            a.set_animated(False)
+        self.animate_dynamic_artists()
+        
+        # report frame rate and dropped frames
+        t = time.perf_counter() - self.playback_t_start
+        dbg.debug_output(f"playback:  {self.playback_frames} frames in {t:.1f} s ({self.playback_frames / max(t, 1e-9):.1f} fps, target {self.chartOptions.playback_fps} fps), {self.playback_dropped} dropped", color_fg='blue', color_bg='white', style='bright')
+        
+        # full redraw at current position
+        self.btn_play.label.set_text("Play")
+        self.update_range_slider(self.r_slider.val)
+        self.fig.canvas.draw_idle()
+        
+    def export_playback(self, path, i_start, i_end):
+        """
+        Save playback of rows i_start to i_end-1 to a video (.mp4, needs
+        ffmpeg) or animated GIF (.gif) without showing a window.
+        """
+        dbg.debug_output(f"LotterySummaryCharts.export_playback({path}, {i_start}, {i_end})", color_fg='blue', color_bg='white', style='bright')
+        fps = self.chartOptions.playback_fps
+        self.prepare_playback(i_start)
+        anim = FuncAnimation(self.fig, self.playback_step, frames=range(i_start, i_end), 
+                             interval=1000 / fps, blit=False, repeat=False, cache_frame_data=False)
+        if path.lower().endswith('.gif'):
+            writer = PillowWriter(fps=fps)
+        else:
+            writer = FFMpegWriter(fps=fps)
+        anim.save(path, writer=writer)
+        print(f"Saved {path}")
    
+    def start_watch(self):
+        dbg.debug_output("LotterySummaryCharts.start_watch()", color_fg='blue', color_bg='white', style='bright')
+        if self.chartOptions.dataSource != 'Local':
+            print(f"Watch needs data source 'Local', not '{self.chartOptions.dataSource}'.")
+            return
+        self.watch_tail = lingest.DrawFileTail(self.lottery.info['path local'])
+        self.watch_timer = self.fig.canvas.new_timer(interval=self.chartOptions.watch_interval_ms)
+        self.watch_timer.add_callback(self.check_watch)
+        self.watch_timer.start()
+        self.fig.canvas.mpl_connect('close_event', lambda event: self.stop_watch())
+        
+    def stop_watch(self):
+        if self.watch_timer is not None:
+            self.watch_timer.stop()
+            self.watch_timer = None
+        
+    def check_watch(self):
+        """
+        Timer callback:  add draws appended to the local file since last
+        check and extend sliders and charts (whole file is read again only
+        if it shrank or was replaced).
+        """
+        if self.ax_slider not in self.fig.axes:
+            # figure reused by newer charts
+            self.stop_watch()
+            return
+        # apply after playback stops
+        if self.anim is not None:
+            return
+        # note:  the cached Lottery may be shared with other charts, so draws
+        #        can be in the store already; compare with the slider steps
+        n_old = len(self.slider_steps)
+        replaced = False
+        if self.watch_tail.changed():
+            new = self.watch_tail.read_new()
+            if new is None:
+                dbg.debug_output(f"check_watch:  {self.watch_tail.path} was replaced; reading whole file", color_fg='blue', color_bg='white', style='bright')
+                self.lottery.store = lingest.readDrawsChunked(self.watch_tail.path, self.lottery.info, max(self.chartOptions.ingest_chunk_size, 1))
+                self.lottery.version += 1
+                self.watch_tail = lingest.DrawFileTail(self.watch_tail.path)
+                self.cum_counts = None
+                replaced = True
+            else:
+                self.lottery.append_draws(*new)
+        store = self.lottery.store
+        if not replaced and len(store) == n_old:
+            return
+        dbg.debug_output(f"check_watch:  {len(store) - n_old:+d} draws", color_fg='blue', color_bg='white', style='bright')
+        # rows shown so far unchanged:  only new draws after them
+        appended = not replaced and 0 < n_old <= len(store) and mpl.dates.date2num(store.dates[n_old - 1]) == self.slider_steps[n_old - 1]
+        self.extend_charts(n_old if appended else 0)
+        
+    def extend_charts(self, n_old):
+        """
+        Extend slider steps, slider limits and cumulative counts after draws
+        were added to lottery.store, then update charts once.
+
+        Parameters
+        ----------
+        n_old : number of rows unchanged at start of lottery.store (draws
+                only appended after them); 0 rebuilds everything.
+
+        """
+        store = self.lottery.store
+        at_end = self.range_rows[1] >= len(self.slider_steps)
+        at_last = self.draw_idx >= len(self.slider_steps) - 1
+        
+        # slider values and index of new draws
+        steps = list(mpl.dates.date2num(store.dates[n_old:]))
+        self.slider_steps = self.slider_steps[:n_old] + steps
+        if n_old == 0:
+            self.step_index = {}
+        self.step_index.update({v: n_old + i for i, v in enumerate(steps)})
+        for slider in (self.r_slider, self.slider):
+            slider.valmin = self.slider_steps[0]
+            slider.valmax = self.slider_steps[-1]
+            slider.valstep = np.array(self.slider_steps)
+            slider.ax.set_xlim(slider.valmin, slider.valmax)
+        
+        # count only new draws
+        if self.cum_counts is not None:
+            if n_old > 0:
+                self.cum_counts = [la.extendCumulativeCounts(self.cum_counts[k], store, special=(k == 1)) for k in range(2)]
+            else:
+                self.cum_counts = None
+        if self.chartOptions.chart_rolling_frequency:
+            self.rolling_cum = self.cumulative_counts()
+        
+        # ranges and draws shown at the end of history follow new draws
+        n = len(self.slider_steps)
+        (i0, i1) = (min(self.range_rows[0], n - 1), n if at_end else min(self.range_rows[1], n))
+        self.draw_idx = n - 1 if at_last else min(self.draw_idx, n - 1)
+        self.set_slider_quiet(self.r_slider, (self.slider_steps[i0], self.slider_steps[max(i0, i1 - 1)]))
+        self.set_slider_quiet(self.slider, self.slider_steps[self.draw_idx])
+        self.update_range_slider(self.r_slider.val)
+        self.fig.canvas.draw_idle()
+        
     def on_key(self, event):
         dbg.debug_output(f"LotterySummaryCharts.on_key({event})", color_fg='blue', color_bg='white', style='bright')
         print('key pressed', event.key, event.xdata, event.ydata)
         
-        # adjust slider
+        # play/pause
+        if event.key == ' ':
+            self.toggle_playback()
+            return
+        
+        # stop playback before moving sliders by keys
+        self.stop_playback()
+        
+        # key repeat:  same key again within NAV_REPEAT_SECONDS doubles the step
+        now = time.perf_counter()
+        if event.key == self.nav_key_last and now - self.nav_key_time < NAV_REPEAT_SECONDS:
+            self.nav_key_repeat = min(self.nav_key_repeat * 2, NAV_REPEAT_MAX)
+        else:
+            self.nav_key_repeat = 1
+        self.nav_key_last = event.key
+        self.nav_key_time = now
+        
+        # adjust slider by draws, calendar periods or to start/end
+        n_last = len(self.slider_steps) - 1
         if event.key in ["up", "right"]:
-            if self.slider.val < self.slider.valmax:            
-                self.slider.set_val(self.slider.valstep[self.slider.valstep.index(self.slider.val) + 1])
-        if event.key in ["down", "left"]:
-            if self.slider.val > self.slider.valmin:
-                self.slider.set_val(self.slider.valstep[self.slider.valstep.index(self.slider.val) - 1])
+            self.set_draw_index(self.draw_idx + self.nav_key_repeat)
+        elif event.key in ["down", "left"]:
+            self.set_draw_index(self.draw_idx - self.nav_key_repeat)
+        elif event.key in NAV_CALENDAR_KEYS:
+            (direction, days) = NAV_CALENDAR_KEYS[event.key]
+            self.set_draw_index(self.calendar_offset(self.draw_idx, direction * days * self.nav_key_repeat))
+        elif event.key == "home":
+            self.set_draw_index(0)
+        elif event.key == "end":
+            self.set_draw_index(n_last)
         
         # adjust range slider right date
-        (l, r) = self.r_slider.val
+        (i0, i1) = self.range_rows
         if event.key in ["cmd+right"]:        
-            if r < self.r_slider.valmax:
-                l_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[0])]
-                r_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[1]) + 1]
-                self.r_slider.set_val((l_new, r_new))
-                
+            self.set_range_rows(i0, min(i1 + self.nav_key_repeat, n_last + 1))
+        # note:  shrinking keeps at least 2 draws and never moves an end outward
         if event.key in ["cmd+left"]:       
-            if r > self.r_slider.valmin and r > l + 1:
-                l_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[0])]
-                r_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[1]) - 1]
-                self.r_slider.set_val((l_new, r_new))
+            self.set_range_rows(i0, min(max(i1 - self.nav_key_repeat, i0 + 2), i1))
                 
         # adjust range slider left date
         if event.key in ["cmd+up"]:
-            if l < self.r_slider.valmax and l < r - 1:
-                l_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[0]) + 1]
-                r_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[1])]
-                self.r_slider.set_val((l_new, r_new))
-                
+            self.set_range_rows(max(min(i0 + self.nav_key_repeat, i1 - 2), i0), i1)
         if event.key in ["cmd+down"]:
-            if l > self.r_slider.valmin:
-                l_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[0]) - 1]
-                r_new = self.r_slider.valstep[self.r_slider.valstep.index(self.r_slider.val[1])]
-                self.r_slider.set_val((l_new, r_new))
+            self.set_range_rows(max(i0 - self.nav_key_repeat, 0), i1)
+            
+    def set_draw_index(self, idx):
+        """
+        Move Draw Date slider to draw idx (clipped to history); the slider
+        callback updates self.draw_idx.
+        """
+        idx = min(max(idx, 0), len(self.slider_steps) - 1)
+        if idx != self.draw_idx:
+            self.slider.set_val(self.slider_steps[idx])
+            
+    def set_range_rows(self, i0, i1):
+        """
+        Move Date Range slider to draws i0 to i1-1 (clipped to history).
+        """
+        i0 = max(i0, 0)
+        i1 = min(i1, len(self.slider_steps))
+        if i1 > i0 and (i0, i1) != tuple(self.range_rows):
+            self.r_slider.set_val((self.slider_steps[i0], self.slider_steps[i1 - 1]))
+            
+    def calendar_offset(self, idx, days):
+        """
+        Returns
+        -------
+        index of first draw on or after (days > 0) or last draw on or before
+        (days < 0) the date of draw idx plus days.
+
+        """
+        target = self.lottery.store.days[idx] + days
+        if days >= 0:
+            return int(np.searchsorted(self.lottery.store.days, target, side='left'))
+        return int(np.searchsorted(self.lottery.store.days, target, side='right')) - 1
 
 #################
 # MAIN APP CODE #
@@ -717,8 +1890,44 @@ class LotterySummaryCharts():
 if __name__=='__main__':    
     dbg.debug_output("Lottery_Summary.py app main started", color_fg='red', color_bg='cyan')
     
-    # use selections from tkinter window to select and display lottery info
-    settings_windows = windows()
-    settings_windows.mainloop()
+    parser = argparse.ArgumentParser(description=f"{APP_NAME} v{APP_VERSION}")
+    parser.add_argument('--export-playback', metavar='PATH', help="save playback through draw dates to .gif or .mp4 without window")
+    parser.add_argument('--game', default=LOTTERY_INFO[0]['name'], help="lottery name")
+    parser.add_argument('--source', default='Local', choices=['Local', 'Internet', 'Database', 'Directory'], help="data source")
+    parser.add_argument('--start', help="first draw date of playback (YYYY-MM-DD)")
+    parser.add_argument('--end', help="last draw date of playback (YYYY-MM-DD)")
+    parser.add_argument('--fps', type=int, default=10, help="playback frames per second")
+    parser.add_argument('--window', type=int, default=0, help="fixed range window in draws (0 = whole history)")
+    parser.add_argument('--memory-profile', action='store_true', help="report memory of load and chart phases on exit")
+    parser.add_argument('--memory-budget', type=int, default=0, metavar='MB', help="fail run if RSS goes over MB (implies --memory-profile)")
+    parser.add_argument('--memory-top', type=int, default=lmem.MEMORY_TOP_SITES, metavar='N', help="allocation sites listed per phase")
+    args = parser.parse_args()
+    
+    if args.memory_profile or args.memory_budget > 0:
+        lmem.startProfiler(args.memory_budget, args.memory_top)
+    
+    if args.export_playback:
+        # headless export of playback animation
+        plt.switch_backend('Agg')
+        options = Chart_Options()
+        options.name = args.game
+        options.dataSource = args.source
+        options.saveData = False
+        options.playback_fps = args.fps
+        options.playback_window = args.window
+        lot = loadLotteryData(options)
+        (i_start, i_end) = lot.store.row_range(pd.Timestamp(args.start) if args.start else lot.store.dates[0],
+                                               pd.Timestamp(args.end) if args.end else lot.store.dates[-1])
+        ch = LotterySummaryCharts(lot, options)
+        ch.export_playback(args.export_playback, i_start, i_end)
+        lot.close()
+    else:
+        # use selections from tkinter window to select and display lottery info
+        settings_windows = windows()
+        settings_windows.mainloop()
+    
+    if not lmem.stopProfiler():
+        print(f"Memory budget of {args.memory_budget} MB exceeded.  Exiting application.")
+        sys.exit(4)
     
 
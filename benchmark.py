@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  benchmark.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Memory and speed comparisons of draw history representations and chart
+    data paths, on the shipped history or on long synthetic histories.
+    Usage:  python3 benchmark.py [number of synthetic draws]
+@references:
+    timeit:  https://docs.python.org/3/library/timeit.html
+    tracemalloc:  https://docs.python.org/3/library/tracemalloc.html
+    pandas memory_usage:  https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.memory_usage.html
+    matplotlib blitting:  https://matplotlib.org/stable/users/explain/animations/blitting.html
+"""
+
+import io
+import os
+import sys
+import time
+import contextlib
+import pickle
+import timeit
+import tempfile
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from draw_store import DrawStore
+import lottery_analysis as la
+import lottery_ingest as lingest
+import lottery_shm as lshm
+
+#############
+# CONSTANTS #
+#############
+BENCH_INFO = {'name': 'Synthetic',
+              'balls range': range(1,71),
+              'special range': range(1,28)}
+BENCH_N_DRAWS = 100_000
+BENCH_REPEAT = 20
+
+# worker process initializer time, set by initPickledWorker() / initSharedWorker()
+_init_seconds = 0.0
+
+#############
+# FUNCTIONS #
+#############
+def syntheticDrawStore(info=BENCH_INFO, n_draws=BENCH_N_DRAWS, seed=0):
+    """
+    Parameters
+    ----------
+    info : LOTTERY_INFO style entry with 'balls range' and 'special range'.
+    n_draws : number of draws, one per day starting 1970-01-01 (pandas
+              Timestamps end in 2262, about 106,000 draws).
+    seed : random seed.
+
+    Returns
+    -------
+    DrawStore of random draws (5 distinct main balls and 1 special ball).
+
+    """
+    rng = np.random.default_rng(seed)
+    n_main = max(info['balls range']) - 1
+    n_special = max(info['special range']) - 1
+    # 5 distinct main balls per draw:  first 5 of a random permutation
+    balls = np.argsort(rng.random((n_draws, n_main)), axis=1)[:, 0:5] + 1
+    special = rng.integers(1, n_special + 1, size=(n_draws, 1))
+    days = np.arange(n_draws)
+    return DrawStore.from_arrays(info, np.hstack([balls, special]), days)
+
+def writeSyntheticCSV(store, path):
+    """
+    Write store in the Texas Lottery export format (first line = header).
+    """
+    dates = pd.DatetimeIndex(store.dates)
+    df = pd.DataFrame({'Game Name': store.info['name'],
+                       'Month': dates.month, 'Day': dates.day, 'Year': dates.year})
+    for c in range(6):
+        df[f"Num{c + 1}" if c < 5 else 'Special'] = store.draws[:, c]
+    df['Multiplier'] = 2
+    df.to_csv(path, index=False)
+
+def peakMemory(fn):
+    """
+    Returns
+    -------
+    (result of fn, seconds, peak bytes allocated by python during fn).
+
+    """
+    tracemalloc.start()
+    t_start = time.perf_counter()
+    result = fn()
+    t = time.perf_counter() - t_start
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, t, peak
+
+def timeBest(fn, repeat=BENCH_REPEAT):
+    """
+    Returns
+    -------
+    best time of repeat calls of fn in seconds.
+
+    """
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+def benchDrawStore(store):
+    """
+    Compare memory and date range lookup latency of DrawStore against the
+    former pandas DataFrame representation of Lottery.df_data.
+    """
+    df_data = store.to_dataframe()
+    n = len(store)
+    d1 = df_data.index[n // 4]
+    d2 = df_data.index[n // 4 + min(n // 2, 1000)]
+
+    def lookupDataFrame():
+        df = df_data.loc[df_data.index >= d1]
+        df = df.loc[df.index <= d2]
+        return np.array([df.loc[row, col] for col in df.columns[0:5] for row in df.index])
+
+    def lookupDataFrameVectorized():
+        df = df_data.loc[d1:d2]
+        return df.iloc[:, 0:5].to_numpy().T.ravel()
+
+    def lookupStore():
+        return store.slice(d1, d2).balls.T.ravel()
+
+    def dateDataFrame():
+        df = df_data.loc[df_data.index >= d1]
+        return df.loc[df.index <= d1 + pd.Timedelta('12:00:00')]
+
+    def dateStore():
+        return store.on_date(d1)
+
+    assert np.array_equal(lookupDataFrameVectorized(), lookupStore())
+
+    print(f"draws:  {n}")
+    print(f"memory  DataFrame:  {df_data.memory_usage(deep=True).sum():>12,d} bytes")
+    print(f"memory  DrawStore:  {store.nbytes:>12,d} bytes")
+    print(f"range lookup ({len(store.slice(d1, d2))} draws)")
+    if n <= 20_000:
+        print(f"    DataFrame (.loc loop):     {timeBest(lookupDataFrame, 3) * 1e3:10.3f} ms")
+    print(f"    DataFrame (vectorized):    {timeBest(lookupDataFrameVectorized) * 1e3:10.3f} ms")
+    print(f"    DrawStore:                 {timeBest(lookupStore) * 1e3:10.3f} ms")
+    print("single date lookup")
+    print(f"    DataFrame:                 {timeBest(dateDataFrame) * 1e3:10.3f} ms")
+    print(f"    DrawStore:                 {timeBest(dateStore) * 1e3:10.3f} ms")
+
+def benchRollingCounts(store, window=50, n_shown=2000):
+    """
+    Time building cumulative counts once and rolling window counts for the
+    draws shown in the range slider window.
+    """
+    cum = la.cumulativeCounts(store)
+    i1 = len(store)
+    i0 = max(0, i1 - n_shown)
+    print(f"cumulative counts ({len(store)} draws):  {timeBest(lambda: la.cumulativeCounts(store), 5) * 1e3:10.3f} ms")
+    print(f"rolling counts N={window}, all draws:      {timeBest(lambda: la.rollingCounts(cum, window)) * 1e3:10.3f} ms")
+    print(f"rolling counts N={window}, {i1 - i0} draws:     {timeBest(lambda: la.rollingCounts(cum, window, i0, i1)) * 1e3:10.3f} ms")
+
+def benchIngest(store, chunk_size=lingest.INGEST_CHUNK_SIZE):
+    """
+    Compare time and peak memory of reading a whole export with pandas and
+    building df_data against streaming chunked ingest.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'draws.csv')
+        writeSyntheticCSV(store, path)
+        print(f"file:  {os.path.getsize(path):,d} bytes, {len(store)} draws")
+
+        def readWhole():
+            # pd.read_csv of whole file + DataFrame with Timestamp index
+            df_import = pd.read_csv(path)
+            dates = pd.to_datetime(pd.DataFrame({'year': df_import.iloc[:, 3], 'month': df_import.iloc[:, 1], 'day': df_import.iloc[:, 2]}))
+            df_data = pd.DataFrame(df_import.iloc[:, 4:10].to_numpy(), index=dates, columns=['Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special'])
+            return DrawStore.from_dataframe(store.info, df_data.sort_index())
+
+        (a, t_whole, peak_whole) = peakMemory(readWhole)
+        (b, t_chunk, peak_chunk) = peakMemory(lambda: lingest.readDrawsChunked(path, store.info, chunk_size))
+        assert np.array_equal(a.draws, b.draws)
+        print(f"read_csv whole:   {t_whole:8.3f} s {len(a) / t_whole:>12,.0f} rows/s  peak {peak_whole:>13,d} bytes")
+        print(f"chunked {chunk_size:>6d}:   {t_chunk:8.3f} s {len(b) / t_chunk:>12,.0f} rows/s  peak {peak_chunk:>13,d} bytes")
+
+def chartHistograms(store, i0, i1):
+    """
+    Returns
+    -------
+    (main, special) ball counts of rows i0 to i1-1 computed like
+    LotterySummaryCharts.update_charts() (np.histogram of the picked balls).
+
+    """
+    rows = store.rows(i0, i1)
+    main = np.histogram(rows.balls.T.ravel(), bins=store.info['balls range'])[0]
+    special = np.histogram(rows.special, bins=store.info['special range'])[0]
+    return main, special
+
+def benchRangeHistograms(store, n_ranges=2000, max_draws=1000, seed=1):
+    """
+    Validate batched range histograms against the update_charts()
+    histograms and time both for random ranges.
+    """
+    rng = np.random.default_rng(seed)
+    i0 = rng.integers(0, len(store), n_ranges)
+    i1 = np.minimum(i0 + rng.integers(1, max_draws, n_ranges), len(store))
+    cum = [la.cumulativeCounts(store, special=False), la.cumulativeCounts(store, special=True)]
+
+    hist = la.batchHistograms(store, i0, i1, ranks=True)
+    for k in range(n_ranges):
+        (main, special) = chartHistograms(store, i0[k], i1[k])
+        # note:  np.histogram counts a ball equal to the top bin edge in the last bin
+        #        (only balls outside the pool); batchHistograms does not count them
+        edge = [np.count_nonzero(store.rows(i0[k], i1[k]).balls == max(store.info['balls range'])),
+                np.count_nonzero(store.rows(i0[k], i1[k]).special == max(store.info['special range']))]
+        main[-1] -= edge[0]
+        special[-1] -= edge[1]
+        assert np.array_equal(hist['balls'][k], main) and np.array_equal(hist['special'][k], special)
+    assert np.array_equal(hist['balls'], la.rangeCounts(cum[0], i0, i1)[:, 1:])
+
+    def loopHistogram():
+        return [chartHistograms(store, i0[k], i1[k]) for k in range(n_ranges)]
+
+    print(f"{n_ranges} ranges of up to {max_draws} draws (validated against update_charts histograms)")
+    print(f"    np.histogram per range:    {timeBest(loopHistogram, 3) * 1e3:10.3f} ms")
+    print(f"    batchHistograms:           {timeBest(lambda: la.batchHistograms(store, i0, i1), 5) * 1e3:10.3f} ms")
+    print(f"    batchHistograms + ranks:   {timeBest(lambda: la.batchHistograms(store, i0, i1, ranks=True), 5) * 1e3:10.3f} ms")
+    print(f"    cumulative counts:         {timeBest(lambda: [la.rangeCounts(c, i0, i1) for c in cum]) * 1e3:10.3f} ms")
+
+def initPickledWorker(info, df_bytes):
+    # process pool initializer of the pickling path:  rebuild arrays in every worker
+    global _init_seconds
+    t_start = time.perf_counter()
+    store = DrawStore.from_dataframe(info, pickle.loads(df_bytes))
+    lshm._worker_arrays = (store, [la.cumulativeCounts(store, special=False), la.cumulativeCounts(store, special=True)])
+    _init_seconds = time.perf_counter() - t_start
+
+def initSharedWorker(spec_bytes):
+    # process pool initializer of the shared memory path
+    global _init_seconds
+    t_start = time.perf_counter()
+    lshm.attachWorker(pickle.loads(spec_bytes))
+    _init_seconds = time.perf_counter() - t_start
+
+def checksumTask(_):
+    # process pool task:  touch worker arrays, report initializer time
+    (store, cum) = lshm._worker_arrays
+    return len(store), int(cum[0][-1].sum()), _init_seconds
+
+def benchSharedMemory(store, workers=4):
+    """
+    Compare worker start up cost of pickling df_data against attaching to
+    shared memory:  time in each worker until it can use the draw arrays
+    and cumulative counts (unpickle + rebuild, or attach), and bytes sent
+    per worker.  Wall time of the pools includes spawning interpreters.
+    """
+    df_bytes = pickle.dumps(store.to_dataframe())
+    context = multiprocessing.get_context('spawn')
+    expected = (len(store), 5 * len(store))
+
+    def runPool(initializer, initargs):
+        t_start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initializer, initargs=initargs) as executor:
+            results = list(executor.map(checksumTask, range(workers)))
+        assert all(r[0:2] == expected for r in results)
+        return time.perf_counter() - t_start, np.mean([r[2] for r in results])
+
+    (t_pickle, init_pickle) = runPool(initPickledWorker, (store.info, df_bytes))
+    t_publish = time.perf_counter()
+    with lshm.SharedDrawArrays(store) as shared:
+        t_publish = time.perf_counter() - t_publish
+        spec_bytes = pickle.dumps(shared.spec)
+        (t_shared, init_shared) = runPool(initSharedWorker, (spec_bytes,))
+    print(f"{workers} spawned workers, {len(store)} draws;  per worker start up, bytes sent per worker, pool wall time")
+    print(f"    pickled df_data:           {init_pickle * 1e3:10.3f} ms {len(df_bytes):>12,d} bytes {t_pickle * 1e3:10.1f} ms")
+    print(f"    shared memory:             {init_shared * 1e3:10.3f} ms {len(spec_bytes):>12,d} bytes {t_shared * 1e3:10.1f} ms (publish once {t_publish * 1e3:.1f} ms)")
+
+def benchMarkerSteps(store, n_steps=200, seed=2):
+    """
+    Per-step latency of moving the Draw Date slider (Agg canvas, debug
+    output discarded):  blitting the slider and ball marker collections
+    against a full figure redraw per step (Slider redrawing the canvas).
+    """
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+    from Lottery_Summary import Chart_Options, Lottery, LotterySummaryCharts
+    lot = Lottery(store.info)
+    lot.store = store
+    steps = np.random.default_rng(seed).integers(0, len(store), n_steps)
+
+    def stepTimes(full_redraw):
+        times = np.empty(n_steps)
+        for (j, i) in enumerate(steps):
+            t_start = time.perf_counter()
+            ch.set_draw_index(int(i))
+            if full_redraw:
+                ch.fig.canvas.draw()
+            times[j] = time.perf_counter() - t_start
+        return times
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ch = LotterySummaryCharts(lot, Chart_Options())
+        ch.fig.canvas.draw()
+        t_blit = stepTimes(False)
+        t_full = stepTimes(True)
+    plt.close(ch.fig)
+    print(f"{n_steps} Draw Date steps, {len(store)} draws;  median, 95th percentile, max per step")
+    for (name, t) in (("full redraw:", t_full), ("blit markers + slider:", t_blit)):
+        print(f"    {name:<27s}{np.median(t) * 1e3:10.3f} ms {np.percentile(t, 95) * 1e3:10.3f} ms {t.max() * 1e3:10.3f} ms")
+
+#################
+# MAIN APP CODE #
+#################
+
+if __name__=='__main__':
+    n_draws = int(sys.argv[1]) if len(sys.argv) > 1 else BENCH_N_DRAWS
+    store = syntheticDrawStore(n_draws=n_draws)
+
+    print("== DrawStore vs DataFrame ==")
+    benchDrawStore(store)
+
+    print("== Rolling frequency ==")
+    benchRollingCounts(store)
+
+    print("== Batched range histograms ==")
+    benchRangeHistograms(store)
+
+    print("== Ingest ==")
+    benchIngest(store)
+
+    print("== Worker start up ==")
+    benchSharedMemory(store)
+
+    print("== Draw Date steps ==")
+    benchMarkerSteps(store)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  draw_store.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Compact array storage of lottery draw history.
+    Balls are kept in one uint8 (draws x 6) array, columns Num1 to Num5 then
+    Special, and draw dates as int32 day numbers (days since 1970-01-01),
+    sorted ascending.  Date range lookups are binary searches returning
+    zero-copy views; to_dataframe() adapts to the former pandas layout.
+@references:
+    Python __slots__:  https://docs.python.org/3/reference/datamodel.html#slots
+    Numpy searchsorted:  https://numpy.org/doc/stable/reference/generated/numpy.searchsorted.html
+    Numpy datetime64:  https://numpy.org/doc/stable/reference/arrays.datetime.html
+"""
+
+import numpy as np
+import pandas as pd
+
+#############
+# CONSTANTS #
+#############
+N_BALLS = 5
+COL_SPECIAL = 5
+DF_COLUMN_NAMES = ['Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special']
+
+#############
+# FUNCTIONS #
+#############
+def dayNumber(d):
+    """
+    Parameters
+    ----------
+    d : pandas Timestamp, datetime, date or numpy datetime64.
+
+    Returns
+    -------
+    int day number (days since 1970-01-01) of the date part of d.
+
+    """
+    return int(np.datetime64(pd.Timestamp(d).to_datetime64(), 'D').astype(np.int64))
+
+#############
+# CLASSES   #
+#############
+class DrawStore():
+    """
+    Draw history of one game as compact numpy arrays.
+
+    Attributes
+    ----------
+    info : LOTTERY_INFO entry of the game.
+    draws : uint8 array (n, 6); columns Num1..Num5, Special.
+    days : int32 array (n,); draw dates as day numbers, ascending.
+
+    Examples
+    --------
+        store = DrawStore.from_dataframe(info, df_data)
+        view = store.slice(pd.Timestamp('2020-01-01'), pd.Timestamp('2020-12-31'))
+        view.balls      # zero-copy (k, 5) view
+        view.to_dataframe()
+    """
+    __slots__ = ('info', 'draws', 'days')
+
+    def __init__(self, info, draws=None, days=None):
+        self.info = info
+        self.draws = np.empty((0, N_BALLS + 1), dtype=np.uint8) if draws is None else draws
+        self.days = np.empty(0, dtype=np.int32) if days is None else days
+
+    @classmethod
+    def from_arrays(cls, info, balls, days):
+        """
+        Parameters
+        ----------
+        info : LOTTERY_INFO entry of the game.
+        balls : integer array (n, 6), any order of rows.
+        days : integer day numbers (n,).
+
+        Returns
+        -------
+        DrawStore sorted by date.
+
+        """
+        balls = np.asarray(balls)
+        if balls.size and (balls.min() < 0 or balls.max() > np.iinfo(np.uint8).max):
+            raise ValueError(f"ball numbers out of uint8 range for {info['name']}")
+        days = np.asarray(days, dtype=np.int32)
+        order = np.argsort(days, kind='stable')
+        return cls(info,
+                   np.ascontiguousarray(balls[order], dtype=np.uint8),
+                   np.ascontiguousarray(days[order]))
+
+    @classmethod
+    def from_dataframe(cls, info, df_data):
+        """
+        Parameters
+        ----------
+        info : LOTTERY_INFO entry of the game.
+        df_data : pandas DataFrame with Timestamp index and columns Num1..Num5, Special.
+
+        Returns
+        -------
+        DrawStore with the same draws.
+
+        """
+        days = df_data.index.values.astype('datetime64[D]').astype(np.int32)
+        return cls.from_arrays(info, df_data.iloc[:, 0:N_BALLS + 1].to_numpy(), days)
+
+    def __len__(self):
+        return len(self.days)
+
+    def __repr__(self):
+        return f"DrawStore({self.info['name']}, {len(self)} draws, {self.nbytes} bytes)"
+
+    @property
+    def balls(self):
+        """(n, 5) view of main balls."""
+        return self.draws[:, 0:N_BALLS]
+
+    @property
+    def special(self):
+        """(n,) view of special balls."""
+        return self.draws[:, COL_SPECIAL]
+
+    @property
+    def dates(self):
+        """datetime64[D] array of draw dates."""
+        return self.days.astype('datetime64[D]')
+
+    @property
+    def nbytes(self):
+        return self.draws.nbytes + self.days.nbytes
+
+    def row_range(self, startDate, endDate):
+        """
+        Returns
+        -------
+        (i0, i1) row offsets so that rows i0 to i1-1 are drawn from
+        startDate to endDate inclusive.
+
+        """
+        i0 = int(np.searchsorted(self.days, dayNumber(startDate), side='left'))
+        i1 = int(np.searchsorted(self.days, dayNumber(endDate), side='right'))
+        return i0, max(i0, i1)
+
+    def row_ranges(self, startDates, endDates):
+        """
+        Parameters
+        ----------
+        startDates, endDates : arrays (K,) of dates, both inclusive.
+
+        Returns
+        -------
+        (i0, i1) int arrays (K,) of row offsets of each date range
+        (vectorized row_range()).
+
+        """
+        d0 = pd.to_datetime(np.asarray(startDates)).values.astype('datetime64[D]').astype(np.int64)
+        d1 = pd.to_datetime(np.asarray(endDates)).values.astype('datetime64[D]').astype(np.int64)
+        i0 = np.searchsorted(self.days, d0, side='left')
+        i1 = np.searchsorted(self.days, d1, side='right')
+        return i0, np.maximum(i0, i1)
+
+    def rows(self, i0, i1):
+        """
+        Returns
+        -------
+        DrawStore of rows i0 to i1-1 sharing memory with this store.
+
+        """
+        return DrawStore(self.info, self.draws[i0:i1], self.days[i0:i1])
+
+    def slice(self, startDate, endDate):
+        """
+        Returns
+        -------
+        zero-copy DrawStore of draws from startDate to endDate inclusive.
+
+        """
+        return self.rows(*self.row_range(startDate, endDate))
+
+    def on_date(self, drawDate):
+        """
+        Returns
+        -------
+        zero-copy DrawStore of the draw on drawDate (0 or 1 rows).
+
+        """
+        return self.slice(drawDate, drawDate)
+
+    def extend(self, balls, days):
+        """
+        Add draws in place (e.g. rows appended to an export); draws on dates
+        already held are skipped, and of several draws on one date in days
+        (any order) only the first is added.
+
+        Parameters
+        ----------
+        balls : integer array (k, 6).
+        days : integer day numbers (k,).
+
+        Returns
+        -------
+        number of draws added.
+
+        """
+        days = np.asarray(days, dtype=np.int32)
+        # sorted unique dates of the batch (first row of each), then dates not held yet
+        (days, first) = np.unique(days, return_index=True)
+        new = ~np.isin(days, self.days)
+        if not new.any():
+            return 0
+        added = DrawStore.from_arrays(self.info, np.asarray(balls)[first[new]], days[new])
+        if len(self.days) == 0 or added.days[0] > self.days[-1]:
+            # usual case:  newer draws, append after the held rows
+            self.draws = np.concatenate([self.draws, added.draws])
+            self.days = np.concatenate([self.days, added.days])
+        else:
+            merged = DrawStore.from_arrays(self.info, np.concatenate([self.draws, added.draws]), np.concatenate([self.days, added.days]))
+            (self.draws, self.days) = (merged.draws, merged.days)
+        return int(new.sum())
+
+    def to_dataframe(self):
+        """
+        Returns
+        -------
+        pandas DataFrame in the former Lottery.df_data layout
+        (Timestamp 'Date' index, int64 columns Num1..Num5, Special).
+
+        """
+        index = pd.DatetimeIndex(self.dates.astype('datetime64[ns]'), name='Date')
+        return pd.DataFrame(self.draws.astype(np.int64), index=index, columns=DF_COLUMN_NAMES)
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_analysis.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Vectorized analysis of draw history held in a draw_store.DrawStore.
+    Ball counts are indexed by ball number, so count matrices line up with
+    LOTTERY_INFO 'balls range' and 'special range'; column 0 collects balls
+    outside the current pool (drawn under earlier game rules).
+    Cumulative count matrices (prefix sums over draws) turn any count over
+    a range of draws into one subtraction of two rows; batchHistograms()
+    counts many ranges at once with one bincount over the draw arrays.
+    Draw level features (ball sum, odd and high ball counts, spread,
+    consecutive numbers) are computed once per history and summarized over
+    ranges the same way from their own cumulative histograms.
+    Calendar codes (weekday, month, year of each draw) split range counts
+    into per-bucket count matrices with one bincount.
+    Rule eras (LOTTERY_INFO 'eras') map to boundary rows of the history once;
+    any range then splits into per-era counts and draws each ball was
+    eligible for (in the pool), giving frequencies comparable across rule
+    changes.
+@references:
+    Numpy bincount:  https://numpy.org/doc/stable/reference/generated/numpy.bincount.html
+    Numpy cumsum:  https://numpy.org/doc/stable/reference/generated/numpy.cumsum.html
+    Prefix sums:  https://en.wikipedia.org/wiki/Prefix_sum
+"""
+
+import numpy as np
+import debug as dbg
+
+#############
+# CONSTANTS #
+#############
+# ball values counted per bincount call of rangeHistograms (bounds memory)
+HIST_MAX_VALUES = 2**22
+
+# draw level features (columns of drawFeatures()) and sum histogram bin width
+FEATURE_NAMES = ['Sum', 'Odd', 'High', 'Spread', 'Consecutive']
+FEATURE_SUM_BIN = 10
+
+# calendar buckets of calendarCodes()
+CALENDAR_BUCKETS = ['weekday', 'month', 'year']
+WEEKDAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+#############
+# FUNCTIONS #
+#############
+def ballBins(info, special=False):
+    """
+    Parameters
+    ----------
+    info : LOTTERY_INFO entry.
+    special : True for special balls, False for main balls.
+
+    Returns
+    -------
+    number of count columns, max ball number + 1 (column 0 for balls
+    outside the pool).
+
+    """
+    r = info['special range'] if special else info['balls range']
+    # note:  ranges stop 1 after the last ball (extra histogram bin)
+    return max(r)
+
+def drawValues(store, special=False):
+    """
+    Returns
+    -------
+    (n, k) array of count columns per draw; k = 5 main balls or 1 special
+    ball.  Balls outside the pool of info map to column 0.
+
+    """
+    values = store.special[:, None] if special else store.balls
+    n_bins = ballBins(store.info, special)
+    return np.where(values < n_bins, values, 0).astype(np.intp)
+
+def countMatrix(store, special=False):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    special : True for special balls, False for main balls.
+
+    Returns
+    -------
+    int32 array (n, bins) of how many times each ball was drawn in each draw
+    (one-hot rows; 5 ones per row for main balls, column 0 = out of pool).
+
+    """
+    values = drawValues(store, special)
+    n_bins = ballBins(store.info, special)
+    n = len(values)
+    flat = (np.arange(n, dtype=np.intp)[:, None] * n_bins + values).ravel()
+    return np.bincount(flat, minlength=n * n_bins).reshape(n, n_bins).astype(np.int32)
+
+def cumulativeCounts(store, special=False):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    special : True for special balls, False for main balls.
+
+    Returns
+    -------
+    int32 array (n + 1, bins); row i holds counts of each ball over draws
+    0 to i-1, so counts over draws i0 to i1-1 are cum[i1] - cum[i0].
+
+    """
+    dbg.debug_output(f"cumulativeCounts({store}, special={special})", color_fg='black', color_bg='cyan')
+    counts = countMatrix(store, special)
+    cum = np.zeros((counts.shape[0] + 1, counts.shape[1]), dtype=np.int32)
+    np.cumsum(counts, axis=0, out=cum[1:])
+    return cum
+
+def extendCumulativeCounts(cum, store, special=False):
+    """
+    Parameters
+    ----------
+    cum : cumulative count matrix of the first rows of store.
+    store : DrawStore with draws appended after those rows.
+    special : True for special balls, False for main balls.
+
+    Returns
+    -------
+    cumulative count matrix of all rows of store; only appended rows are
+    counted.
+
+    """
+    i0 = cum.shape[0] - 1
+    counts = countMatrix(store.rows(i0, len(store)), special)
+    ext = np.empty((len(store) + 1, cum.shape[1]), dtype=np.int32)
+    ext[:i0 + 1] = cum
+    np.cumsum(counts, axis=0, out=ext[i0 + 1:])
+    ext[i0 + 1:] += cum[i0]
+    return ext
+
+def rollingCounts(cum, window, i0=0, i1=None):
+    """
+    Parameters
+    ----------
+    cum : cumulative count matrix from cumulativeCounts().
+    window : number of draws N in sliding window.
+    i0, i1 : rows i0 to i1-1 for which to return rolling counts.
+
+    Returns
+    -------
+    int32 array (i1 - i0, bins); row j holds counts of each ball over the
+    window of N draws ending at draw i0 + j (shorter at start of history).
+
+    """
+    if i1 is None:
+        i1 = cum.shape[0] - 1
+    end = np.arange(i0 + 1, i1 + 1)
+    start = np.maximum(end - window, 0)
+    return cum[end] - cum[start]
+
+def rangeCounts(cum, i0, i1):
+    """
+    Parameters
+    ----------
+    cum : cumulative count matrix from cumulativeCounts().
+    i0, i1 : int arrays (K,) of row offsets; range k is rows i0[k] to i1[k]-1.
+
+    Returns
+    -------
+    int32 array (K, bins) of ball counts in each range.
+
+    """
+    return cum[np.asarray(i1)] - cum[np.asarray(i0)]
+
+def ballRanks(counts, block=1024):
+    """
+    Parameters
+    ----------
+    counts : int array (K, balls) of ball counts per range.
+    block : rows compared at once (bounds memory to block * balls^2 bytes).
+
+    Returns
+    -------
+    int32 array (K, balls); 1 = most drawn ball of the range, tied counts
+    share the same (lowest) rank.
+
+    """
+    counts = np.atleast_2d(counts)
+    ranks = np.empty(counts.shape, dtype=np.int32)
+    for k in range(0, counts.shape[0], block):
+        c = counts[k:k + block]
+        # rank = 1 + number of balls drawn more often
+        ranks[k:k + block] = 1 + (c[:, None, :] > c[:, :, None]).sum(axis=2)
+    return ranks
+
+def rangeHistograms(store, i0, i1, special=False, max_values=HIST_MAX_VALUES):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    i0, i1 : int arrays (K,) of row offsets; range k is rows i0[k] to i1[k]-1.
+    special : True for special balls, False for main balls.
+    max_values : ball values counted per bincount call.
+
+    Returns
+    -------
+    int32 array (K, balls) of ball counts in each range; column j = ball
+    j+1 (balls outside the pool are not counted).
+
+    """
+    values = drawValues(store, special)
+    n_bins = ballBins(store.info, special)
+    i0 = np.asarray(i0, dtype=np.intp).ravel()
+    i1 = np.asarray(i1, dtype=np.intp).ravel()
+    lengths = np.maximum(i1 - i0, 0)
+    counts = np.empty((len(i0), n_bins - 1), dtype=np.int32)
+
+    # blocks of ranges with at most about max_values values each
+    per_row = values.shape[1]
+    ends = np.cumsum(lengths) * per_row
+    k0 = 0
+    while k0 < len(i0):
+        base = ends[k0 - 1] if k0 > 0 else 0
+        k1 = max(k0 + 1, int(np.searchsorted(ends, base + max_values, side='right')))
+        n = lengths[k0:k1]
+        # rows of all ranges of block back to back; bin = range * n_bins + ball
+        first = np.cumsum(n) - n
+        rows = np.arange(n.sum()) - np.repeat(first - i0[k0:k1], n)
+        flat = (np.repeat(np.arange(k1 - k0) * n_bins, n)[:, None] + values[rows]).ravel()
+        counts[k0:k1] = np.bincount(flat, minlength=(k1 - k0) * n_bins).reshape(k1 - k0, n_bins)[:, 1:]
+        k0 = k1
+    return counts
+
+def batchHistograms(store, starts, ends, ranks=False):
+    """
+    Ball counts of many ranges in one call.
+
+    Parameters
+    ----------
+    store : DrawStore.
+    starts, ends : arrays (K,) of row offsets (integers; ends exclusive) or
+                   of dates (both inclusive).
+    ranks : True to add rank matrices (ballRanks()).
+
+    Returns
+    -------
+    dictionary with 'balls' (K, main balls) and 'special' (K, special balls)
+    int32 count matrices, column j = ball j+1, and with ranks=True
+    'balls_rank' and 'special_rank'.
+
+    Examples
+    --------
+        hist = batchHistograms(store, ['2020-01-01', '2021-01-01'], ['2020-12-31', '2021-12-31'], ranks=True)
+        hist['balls'][0]   # counts of balls 1.. in 2020
+
+    """
+    dbg.debug_output(f"batchHistograms({store}, {len(starts)} ranges)", color_fg='black', color_bg='cyan')
+    starts = np.asarray(starts)
+    ends = np.asarray(ends)
+    if np.issubdtype(starts.dtype, np.integer) and np.issubdtype(ends.dtype, np.integer):
+        (i0, i1) = (starts, ends)
+    else:
+        (i0, i1) = store.row_ranges(starts, ends)
+    result = {'balls': rangeHistograms(store, i0, i1, special=False),
+              'special': rangeHistograms(store, i0, i1, special=True)}
+    if ranks:
+        result['balls_rank'] = ballRanks(result['balls'])
+        result['special_rank'] = ballRanks(result['special'])
+    return result
+
+def drawFeatures(store):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+
+    Returns
+    -------
+    int16 array (n, 5) of main ball features per draw, columns FEATURE_NAMES:
+    sum of balls, number of odd balls (even = 5 - odd), number of high
+    balls (upper half of the current pool), max - min spread, and number
+    of consecutive pairs (e.g. 7 8 9 = 2).
+
+    """
+    dbg.debug_output(f"drawFeatures({store})", color_fg='black', color_bg='cyan')
+    balls = np.sort(store.balls.astype(np.int16), axis=1)
+    n_pool = ballBins(store.info) - 1
+    features = np.empty((len(balls), len(FEATURE_NAMES)), dtype=np.int16)
+    features[:, 0] = balls.sum(axis=1)
+    features[:, 1] = (balls % 2).sum(axis=1)
+    features[:, 2] = (balls > n_pool // 2).sum(axis=1)
+    features[:, 3] = balls[:, -1] - balls[:, 0]
+    features[:, 4] = (np.diff(balls, axis=1) == 1).sum(axis=1)
+    return features
+
+def featureBins(features):
+    """
+    Returns
+    -------
+    int array (n, 5) of histogram bins of features (sum in bins of
+    FEATURE_SUM_BIN, other features by value).
+
+    """
+    bins = features.astype(np.intp)
+    bins[:, 0] //= FEATURE_SUM_BIN
+    return bins
+
+def featureCumulativeCounts(features):
+    """
+    Parameters
+    ----------
+    features : array (n, 5) from drawFeatures().
+
+    Returns
+    -------
+    list of int32 arrays (n + 1, bins), one per feature; histogram of a
+    feature over draws i0 to i1-1 is cum[i1] - cum[i0] (bin b = value b, or
+    sum values b * FEATURE_SUM_BIN to (b + 1) * FEATURE_SUM_BIN - 1).
+
+    """
+    bins = featureBins(features)
+    n = len(bins)
+    cums = []
+    for f in range(bins.shape[1]):
+        n_bins = int(bins[:, f].max()) + 1 if n else 1
+        counts = np.bincount(np.arange(n, dtype=np.intp) * n_bins + bins[:, f], minlength=n * n_bins).reshape(n, n_bins)
+        cum = np.zeros((n + 1, n_bins), dtype=np.int32)
+        np.cumsum(counts, axis=0, out=cum[1:])
+        cums.append(cum)
+    return cums
+
+def calendarCodes(store):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+
+    Returns
+    -------
+    dictionary by CALENDAR_BUCKETS of (codes, labels):  int16 array (n,) of
+    bucket of each draw (weekday 0 = Monday, month 0 = January, year 0 =
+    first year of history) and list of bucket labels.
+
+    """
+    days = store.days.astype(np.int64)
+    months = store.dates.astype('datetime64[M]').astype(np.int64)
+    years = months // 12
+    y0 = int(years[0]) if len(years) else 0
+    n_years = int(years[-1]) - y0 + 1 if len(years) else 0
+    return {'weekday': (((days + 3) % 7).astype(np.int16), WEEKDAY_NAMES),   # 1970-01-01 was a Thursday
+            'month': ((months % 12).astype(np.int16), MONTH_NAMES),
+            'year': ((years - y0).astype(np.int16), [f"{1970 + y0 + k}" for k in range(n_years)])}
+
+def groupedHistograms(store, codes, n_groups, i0, i1, special=False):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    codes : int array (n,) of bucket of each draw (calendarCodes()).
+    n_groups : number of buckets.
+    i0, i1 : rows i0 to i1-1 counted.
+    special : True for special balls, False for main balls.
+
+    Returns
+    -------
+    (counts, draws):  int array (n_groups, balls) of ball counts per bucket
+    (column j = ball j+1) and int array (n_groups,) of draws per bucket.
+
+    """
+    values = drawValues(store.rows(i0, i1), special)
+    n_bins = ballBins(store.info, special)
+    group = codes[i0:i1].astype(np.intp)
+    flat = (group[:, None] * n_bins + values).ravel()
+    counts = np.bincount(flat, minlength=n_groups * n_bins).reshape(n_groups, n_bins)[:, 1:]
+    return counts, np.bincount(group, minlength=n_groups)
+
+def gameEras(info):
+    """
+    Returns
+    -------
+    list of rule eras of info ('eras' entries; one era of the current
+    ranges if info has none).
+
+    """
+    eras = info.get('eras')
+    if not eras:
+        return [{'start': None, 'balls range': info['balls range'], 'special range': info['special range']}]
+    return eras
+
+def eraIndex(store):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+
+    Returns
+    -------
+    int array (eras + 1,) of era boundary rows; era e covers rows
+    bounds[e] to bounds[e+1]-1 (draws before the first era start count as
+    first era).
+
+    """
+    eras = gameEras(store.info)
+    starts = [np.datetime64(e['start'], 'D').astype(np.int64) if e['start'] else np.iinfo(np.int64).min for e in eras]
+    bounds = np.empty(len(eras) + 1, dtype=np.intp)
+    bounds[:-1] = np.searchsorted(store.days, starts, side='left')
+    bounds[0] = 0
+    bounds[-1] = len(store)
+    return bounds
+
+def eraPools(info, special=False):
+    """
+    Returns
+    -------
+    bool array (eras, balls) of balls of the current ranges in the pool of
+    each era; column j = ball j+1.
+
+    """
+    n_bins = ballBins(info, special)
+    balls = np.arange(1, n_bins)
+    return np.array([balls < max(e['special range'] if special else e['balls range']) for e in gameEras(info)], dtype=bool).reshape(-1, n_bins - 1)
+
+def eraDraws(bounds, i0, i1):
+    """
+    Returns
+    -------
+    int array (..., eras) of draws of rows i0 to i1-1 in each era (i0, i1
+    ints or arrays (K,)).
+
+    """
+    i0 = np.asarray(i0)[..., None]
+    i1 = np.asarray(i1)[..., None]
+    return np.maximum(np.minimum(i1, bounds[1:]) - np.maximum(i0, bounds[:-1]), 0)
+
+def eraCounts(cum, bounds, i0, i1):
+    """
+    Parameters
+    ----------
+    cum : cumulative count matrix from cumulativeCounts().
+    bounds : era boundary rows from eraIndex().
+    i0, i1 : rows i0 to i1-1 (ints or arrays (K,)).
+
+    Returns
+    -------
+    int32 array (..., eras, bins) of ball counts of the range in each era
+    (column 0 = balls outside the current pool).
+
+    """
+    i0 = np.asarray(i0)[..., None]
+    i1 = np.asarray(i1)[..., None]
+    return cum[np.clip(bounds[1:], i0, i1)] - cum[np.clip(bounds[:-1], i0, i1)]
+
+def eligibleDraws(info, bounds, i0, i1, special=False):
+    """
+    Returns
+    -------
+    int array (..., balls) of draws of rows i0 to i1-1 in which each ball
+    of the current ranges was in the pool; column j = ball j+1.
+
+    """
+    return eraDraws(bounds, i0, i1) @ eraPools(info, special).astype(np.int64)
+
+def normalizedFrequency(cum, info, bounds, i0, i1, special=False):
+    """
+    Parameters
+    ----------
+    cum : cumulative count matrix from cumulativeCounts().
+    info : LOTTERY_INFO entry.
+    bounds : era boundary rows from eraIndex().
+    i0, i1 : rows i0 to i1-1 (ints or arrays (K,)).
+    special : True for special balls, False for main balls.
+
+    Returns
+    -------
+    float array (..., balls) of share of eligible draws in which each ball
+    was drawn (count / eligibleDraws(); 0 if never eligible).
+
+    """
+    counts = (cum[np.asarray(i1)] - cum[np.asarray(i0)])[..., 1:]
+    eligible = eligibleDraws(info, bounds, i0, i1, special)
+    return np.divide(counts, eligible, out=np.zeros(counts.shape), where=eligible > 0)
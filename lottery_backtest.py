@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_backtest.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Backtest ball picking rules against every draw of the history.
+    Each rule picks 5 main balls (or 1 special ball) for a draw using only
+    the draws before it:
+        hot       most drawn balls in the prior N draws
+        cold      least drawn balls in the prior N draws
+        overdue   balls not drawn for the most draws (N not used)
+    Picks of all draws come from the cumulative count matrix
+    (lottery_analysis.cumulativeCounts) in one vectorized step per rule and
+    window; the grid of rules and windows is spread across a process pool.
+    Results are hit rate tables (mean matches per draw and distribution of
+    matches) written as CSV and optionally charted.
+    Usage example:
+        python3 lottery_backtest.py --game Powerball --windows 10 25 50 100 200 --workers 4 -o backtest.csv --plot backtest.png
+@references:
+    Backtesting:  https://en.wikipedia.org/wiki/Backtesting
+    Numpy take_along_axis:  https://numpy.org/doc/stable/reference/generated/numpy.take_along_axis.html
+    Numpy ufunc accumulate:  https://numpy.org/doc/stable/reference/generated/numpy.ufunc.accumulate.html
+    concurrent.futures:  https://docs.python.org/3/library/concurrent.futures.html
+"""
+
+import sys
+import csv
+import argparse
+from math import comb
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import matplotlib.pyplot as plt
+import debug as dbg
+import lottery_analysis as la
+import lottery_shm as lshm
+from draw_store import N_BALLS
+
+#############
+# CONSTANTS #
+#############
+BACKTEST_STRATEGIES = ['hot', 'cold', 'overdue']
+BACKTEST_WINDOWS = [10, 25, 50, 100, 200]
+
+#############
+# FUNCTIONS #
+#############
+def backtestState(store, special=False):
+    """
+    Returns
+    -------
+    dictionary of arrays shared by all rules of one game:  'cum'
+    cumulative counts, 'drawn' one-hot counts per draw, 'last' row each
+    ball was last drawn in before each draw (-1 = never) and 'pool' balls
+    in the pool of the rule era of each draw; column 0 (out of pool)
+    dropped from all; 'bounds' era boundary rows (lottery_analysis.eraIndex).
+
+    """
+    counts = la.countMatrix(store, special)[:, 1:]
+    bounds = la.eraIndex(store)
+    # era of each row (rows before the first era start count as first era)
+    era = np.searchsorted(bounds[1:], np.arange(len(store)), side='right')
+    cum = np.zeros((counts.shape[0] + 1, counts.shape[1]), dtype=np.int32)
+    np.cumsum(counts, axis=0, out=cum[1:])
+    rows = np.arange(len(counts), dtype=np.int32)[:, None]
+    # row t = last row < t with the ball drawn
+    last = np.full(cum.shape, -1, dtype=np.int32)
+    np.maximum.accumulate(np.where(counts > 0, rows, -1), axis=0, out=last[1:])
+    return {'cum': cum, 'drawn': counts, 'last': last, 'pool': la.eraPools(store.info, special)[era], 'bounds': bounds, 'picks': 1 if special else N_BALLS}
+
+def pickBalls(state, strategy, window, t0):
+    """
+    Parameters
+    ----------
+    state : backtestState().
+    strategy : one of BACKTEST_STRATEGIES.
+    window : number of prior draws N (hot, cold).
+    t0 : first draw picked for.
+
+    Returns
+    -------
+    int array (n - t0, picks) of ball columns picked for draws t0 to n-1
+    (ball = column + 1); ties go to the lower ball number.  Balls outside
+    the pool of a draw's rule era are never picked.
+
+    """
+    cum = state['cum']
+    t = np.arange(t0, cum.shape[0] - 1)
+    if strategy == 'hot':
+        score = -(cum[t] - cum[np.maximum(t - window, 0)])
+    elif strategy == 'cold':
+        score = cum[t] - cum[np.maximum(t - window, 0)]
+    elif strategy == 'overdue':
+        # row last drawn before draw t (earliest = most overdue)
+        score = state['last'][t]
+    else:
+        raise ValueError(f"unknown strategy {strategy}")
+    score = np.where(state['pool'][t], score, np.inf)
+    return np.argsort(score, axis=1, kind='stable')[:, :state['picks']]
+
+def evaluateStrategy(strategy, window, t0, state=None):
+    """
+    Parameters
+    ----------
+    strategy, window : rule and window N.
+    t0 : first draw tested.
+    state : backtestState(); defaults to the worker process state set by
+            lottery_shm.initWorkerState().
+
+    Returns
+    -------
+    hit rate table row (dictionary):  strategy, window, draws, mean_hits
+    and hits_0 .. hits_<picks> (share of draws with that many matches).
+
+    """
+    state = lshm.workerState(state)
+    picks = pickBalls(state, strategy, window, t0)
+    hits = np.take_along_axis(state['drawn'][t0:], picks, axis=1).sum(axis=1)
+    dist = np.bincount(hits, minlength=state['picks'] + 1) / max(len(hits), 1)
+    row = {'strategy': strategy, 'window': window if strategy != 'overdue' else 0,
+           'draws': len(hits), 'mean_hits': float(hits.mean()) if len(hits) else 0.0}
+    row.update({f"hits_{k}": float(dist[k]) for k in range(state['picks'] + 1)})
+    return row
+
+def evaluateTask(args):
+    # process pool task:  (strategy, window, t0) -> evaluateStrategy row
+    return evaluateStrategy(*args)
+
+def backtest(store, strategies=BACKTEST_STRATEGIES, windows=BACKTEST_WINDOWS, special=False, workers=1):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    strategies : rules from BACKTEST_STRATEGIES.
+    windows : windows N of prior draws.
+    special : True to pick 1 special ball, False to pick 5 main balls.
+    workers : number of worker processes (1 = this process).
+
+    Returns
+    -------
+    list of hit rate table rows, one per (strategy, window); all rows are
+    scored on the same draws (after the longest window), plus a 'random'
+    row with the expected rate of random picks (per rule era pool size,
+    weighted by the draws scored in each era).
+
+    """
+    dbg.debug_output(f"backtest({store}, {strategies}, {windows}, special={special}, workers={workers})", color_fg='black', color_bg='cyan')
+    state = backtestState(store, special)
+    t0 = min(max(windows), len(store))
+    # overdue does not use the window:  evaluated once
+    grid = [(s, w, t0) for (s, w) in product(strategies, windows) if s != 'overdue' or w == windows[0]]
+    if workers <= 1 or len(grid) <= 1:
+        rows = [evaluateStrategy(*g, state=state) for g in grid]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=lshm.initWorkerState, initargs=(state,)) as executor:
+            rows = list(executor.map(evaluateTask, grid))
+
+    # random picks:  hypergeometric matches of picks out of each era's pool,
+    # weighted by draws scored in that era
+    k = state['picks']
+    weights = la.eraDraws(state['bounds'], t0, len(store)) / max(len(store) - t0, 1)
+    # note:  era ranges, not eraPools() columns (older special ranges were wider than the current one)
+    n_pools = [max(e['special range'] if special else e['balls range']) - 1 for e in la.gameEras(store.info)]
+    random_row = {'strategy': 'random', 'window': 0, 'draws': len(store) - t0,
+                  'mean_hits': float(sum(w * k * k / n for (w, n) in zip(weights, n_pools)))}
+    random_row.update({f"hits_{m}": float(sum(w * comb(k, m) * comb(n - k, k - m) / comb(n, k) for (w, n) in zip(weights, n_pools))) for m in range(k + 1)})
+    return rows + [random_row]
+
+def writeTable(rows, fh):
+    """
+    Write hit rate table rows as CSV.
+
+    Returns
+    -------
+    number of rows written.
+
+    """
+    writer = csv.DictWriter(fh, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    return len(rows)
+
+def plotHitRates(rows, title=""):
+    """
+    Returns
+    -------
+    matplotlib figure of mean matches per draw vs window N for each rule,
+    with the random pick rate as reference line.
+
+    """
+    fig, ax = plt.subplots(figsize=(8, 4))
+    windows = sorted({r['window'] for r in rows if r['strategy'] not in ('overdue', 'random')})
+    for strategy in sorted({r['strategy'] for r in rows}):
+        sel = [r for r in rows if r['strategy'] == strategy]
+        if strategy in ('overdue', 'random'):
+            ax.axhline(sel[0]['mean_hits'], linestyle='--' if strategy == 'random' else ':', color='k' if strategy == 'random' else 'm', label=strategy)
+        else:
+            ax.plot([r['window'] for r in sel], [r['mean_hits'] for r in sel], marker='o', label=strategy)
+    if windows:
+        ax.set_xscale('log')
+        ax.set_xticks(windows, labels=[f"{w}" for w in windows])
+    ax.set_xlabel("window N (prior draws)")
+    ax.set_ylabel("mean matches per draw")
+    ax.set_title(title)
+    ax.legend()
+    fig.tight_layout()
+    return fig
+
+#################
+# MAIN APP CODE #
+#################
+
+if __name__=='__main__':
+    from Lottery_Summary import Chart_Options, loadLotteryData
+
+    parser = argparse.ArgumentParser(description="Backtest ball picking rules against the draw history.")
+    parser.add_argument('--game', default='Powerball', help="lottery name")
+    parser.add_argument('--source', default='Local', choices=['Local', 'Internet', 'Database', 'Directory'], help="data source")
+    parser.add_argument('--strategies', nargs='+', default=BACKTEST_STRATEGIES, choices=BACKTEST_STRATEGIES)
+    parser.add_argument('--windows', nargs='+', type=int, default=BACKTEST_WINDOWS, help="windows N of prior draws")
+    parser.add_argument('--special', action='store_true', help="pick the special ball instead of main balls")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes")
+    parser.add_argument('-o', '--output', required=True, help="CSV file of hit rate table")
+    parser.add_argument('--plot', help="image file of hit rate chart")
+    args = parser.parse_args()
+    if min(args.windows) < 1:
+        print("Windows must be at least 1 draw.")
+        sys.exit(2)
+
+    options = Chart_Options()
+    options.name = args.game
+    options.dataSource = args.source
+    options.saveData = False
+    lot = loadLotteryData(options)
+
+    rows = backtest(lot.store, args.strategies, args.windows, args.special, args.workers)
+    with open(args.output, 'w', newline='') as fh:
+        writeTable(rows, fh)
+    print(f"Saved {args.output}")
+    if args.plot:
+        fig = plotHitRates(rows, f"{lot.info['name']} {'special ball' if args.special else 'main balls'}:  {rows[0]['draws']} draws")
+        fig.savefig(args.plot)
+        print(f"Saved {args.plot}")
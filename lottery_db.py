@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_db.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    SQLite storage of draw history for all lottery games in one database file.
+    Draws are keyed by (game, draw_date) so refreshing from a new export is an
+    idempotent upsert, and date range or single date lookups read only the
+    rows needed by the charts instead of whole CSV files.
+@references:
+    sqlite3:  https://docs.python.org/3/library/sqlite3.html
+    SQLite UPSERT:  https://www.sqlite.org/lang_upsert.html
+    SQLite WITHOUT ROWID tables:  https://www.sqlite.org/withoutrowid.html
+    pandas read_csv chunksize:  https://pandas.pydata.org/docs/reference/api/pandas.read_csv.html
+"""
+
+import os
+import sys
+import sqlite3
+import pandas as pd
+import debug as dbg
+from lottery_ingest import fetchSource, hasHeader
+
+#############
+# CONSTANTS #
+#############
+DB_PATH_DEFAULT = 'Lottery.db'
+# number of rows written per transaction by bulk imports
+DB_BATCH_SIZE = 1000
+
+# Texas Lottery export column positions:
+# ['Game Name', 'Month', 'Day', 'Year', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special', 'Multiplier']
+CSV_COL_MONTH = 1
+CSV_COL_DAY = 2
+CSV_COL_YEAR = 3
+CSV_COLS_BALLS = [4, 5, 6, 7, 8, 9]
+CSV_COL_MULTIPLIER = 10
+
+# primary key (game, draw_date) is the clustered index of a WITHOUT ROWID
+# table, so range scans for one game read consecutive pages in date order
+SQL_CREATE = """
+CREATE TABLE IF NOT EXISTS draws (
+    game        TEXT    NOT NULL,
+    draw_date   TEXT    NOT NULL,
+    num1        INTEGER NOT NULL,
+    num2        INTEGER NOT NULL,
+    num3        INTEGER NOT NULL,
+    num4        INTEGER NOT NULL,
+    num5        INTEGER NOT NULL,
+    special     INTEGER NOT NULL,
+    multiplier  REAL,
+    PRIMARY KEY (game, draw_date)
+) WITHOUT ROWID
+"""
+
+SQL_UPSERT = """
+INSERT INTO draws (game, draw_date, num1, num2, num3, num4, num5, special, multiplier)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (game, draw_date) DO UPDATE SET
+    num1 = excluded.num1,
+    num2 = excluded.num2,
+    num3 = excluded.num3,
+    num4 = excluded.num4,
+    num5 = excluded.num5,
+    special = excluded.special,
+    multiplier = COALESCE(excluded.multiplier, draws.multiplier)
+"""
+
+SQL_SELECT_RANGE = """
+SELECT draw_date, num1, num2, num3, num4, num5, special
+FROM draws
+WHERE game = ? AND draw_date BETWEEN ? AND ?
+ORDER BY draw_date
+"""
+
+SQL_SELECT_ALL = """
+SELECT draw_date, num1, num2, num3, num4, num5, special
+FROM draws
+WHERE game = ?
+ORDER BY draw_date
+"""
+
+DF_COLUMN_NAMES = ['Date', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special']
+
+#############
+# FUNCTIONS #
+#############
+def dateKey(d):
+    """
+    Parameters
+    ----------
+    d : pandas Timestamp, datetime or date.
+
+    Returns
+    -------
+    ISO date string 'YYYY-MM-DD' used as draw_date in the database.
+
+    """
+    return f"{d:%Y-%m-%d}"
+
+def rowsFromCSVChunk(df_chunk):
+    """
+    Parameters
+    ----------
+    df_chunk : pandas DataFrame read from a Texas Lottery export.
+
+    Returns
+    -------
+    list of (draw_date, num1, num2, num3, num4, num5, special, multiplier)
+    tuples ready for SQL_UPSERT (without the game column).
+
+    """
+    years = df_chunk.iloc[:, CSV_COL_YEAR].astype(int)
+    months = df_chunk.iloc[:, CSV_COL_MONTH].astype(int)
+    days = df_chunk.iloc[:, CSV_COL_DAY].astype(int)
+    balls = df_chunk.iloc[:, CSV_COLS_BALLS].astype(int).to_numpy()
+    if df_chunk.shape[1] > CSV_COL_MULTIPLIER:
+        multipliers = pd.to_numeric(df_chunk.iloc[:, CSV_COL_MULTIPLIER], errors='coerce')
+    else:
+        multipliers = pd.Series([None] * len(df_chunk))
+
+    rows = []
+    for y, m, d, b, x in zip(years, months, days, balls, multipliers):
+        rows.append((f"{y:04d}-{m:02d}-{d:02d}",
+                     int(b[0]), int(b[1]), int(b[2]), int(b[3]), int(b[4]), int(b[5]),
+                     None if pd.isna(x) else float(x)))
+    return rows
+
+def dataFrameFromRows(rows):
+    """
+    Parameters
+    ----------
+    rows : list of (draw_date, num1, num2, num3, num4, num5, special) tuples.
+
+    Returns
+    -------
+    pandas DataFrame in the Lottery.df_data format (Timestamp 'Date' index,
+    columns Num1 to Num5 and Special).
+
+    """
+    df = pd.DataFrame.from_records(rows, columns=DF_COLUMN_NAMES)
+    df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d')
+    df = df.set_index('Date')
+    return df.astype('int64')
+
+#############
+# CLASSES   #
+#############
+class LotteryDatabase():
+    """
+    SQLite database holding the draw history of every game.
+
+    Examples
+    --------
+        with LotteryDatabase('Lottery.db') as db:
+            db.import_csv('Powerball', 'Powerball/Powerball.csv')
+            df = db.get_range('Powerball', pd.Timestamp('2020-01-01'), pd.Timestamp('2020-12-31'))
+    """
+
+    def __init__(self, path=DB_PATH_DEFAULT):
+        dbg.debug_output(f"LotteryDatabase.__init__({path})", color_fg='black', color_bg='yellow')
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SQL_CREATE)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def upsert_draws(self, game, rows):
+        """
+        Parameters
+        ----------
+        game : game name, e. g. LOTTERY_INFO[i]['name'].
+        rows : iterable of (draw_date, num1, num2, num3, num4, num5, special, multiplier).
+
+        Returns
+        -------
+        number of rows written; all rows are written in one transaction
+        (a multiplier of None keeps the stored one).
+
+        """
+        params = [(game,) + tuple(r) for r in rows]
+        with self.conn:
+            self.conn.executemany(SQL_UPSERT, params)
+        return len(params)
+
+    def upsert_dataframe(self, game, df_data):
+        """
+        Parameters
+        ----------
+        game : game name.
+        df_data : pandas DataFrame in the Lottery.df_data format.
+
+        Returns
+        -------
+        number of rows written.
+
+        """
+        dbg.debug_output(f"LotteryDatabase.upsert_dataframe({game})", color_fg='black', color_bg='yellow')
+        rows = [(dateKey(d), *(int(v) for v in values), None)
+                for d, values in zip(df_data.index, df_data.iloc[:, 0:6].to_numpy())]
+        return self.upsert_draws(game, rows)
+
+    def import_csv(self, game, path, batch_size=DB_BATCH_SIZE):
+        """
+        Bulk import a Texas Lottery export, one transaction per batch.
+
+        Parameters
+        ----------
+        game : game name.
+        path : local path or URL of the CSV export.
+        batch_size : rows per transaction.
+
+        Returns
+        -------
+        number of rows written.
+
+        """
+        dbg.debug_output(f"LotteryDatabase.import_csv({game}, {path})", color_fg='black', color_bg='yellow')
+        count = 0
+        # note:  Texas Lottery exports have no header; files saved by to_csv have one
+        source = fetchSource(path)
+        for df_chunk in pd.read_csv(source, header=0 if hasHeader(source) else None, chunksize=batch_size):
+            count += self.upsert_draws(game, rowsFromCSVChunk(df_chunk))
+        dbg.debug_output(f"LotteryDatabase.import_csv:  {count} rows", color_fg='black', color_bg='yellow')
+        return count
+
+    def count(self, game):
+        (n,) = self.conn.execute("SELECT COUNT(*) FROM draws WHERE game = ?", (game,)).fetchone()
+        return n
+
+    def get_all(self, game):
+        """
+        Returns
+        -------
+        pandas DataFrame with all draws of game, sorted by date.
+
+        """
+        return dataFrameFromRows(self.conn.execute(SQL_SELECT_ALL, (game,)).fetchall())
+
+    def get_range(self, game, startDate, endDate):
+        """
+        Parameters
+        ----------
+        game : game name.
+        startDate : first draw date (inclusive).
+        endDate : last draw date (inclusive).
+
+        Returns
+        -------
+        pandas DataFrame with draws of game between startDate and endDate.
+
+        """
+        rows = self.conn.execute(SQL_SELECT_RANGE, (game, dateKey(startDate), dateKey(endDate))).fetchall()
+        return dataFrameFromRows(rows)
+
+    def get_on_date(self, game, drawDate):
+        """
+        Returns
+        -------
+        pandas DataFrame with the draw of game on drawDate (0 or 1 rows).
+
+        """
+        return self.get_range(game, drawDate, drawDate)
+
+#################
+# MAIN APP CODE #
+#################
+
+if __name__=='__main__':
+    # bulk import local CSV files of all games into the database
+    # usage:  python3 lottery_db.py [database path]
+    from Lottery_Summary import LOTTERY_INFO
+
+    with LotteryDatabase(sys.argv[1] if len(sys.argv) > 1 else DB_PATH_DEFAULT) as db:
+        for i in range(len(LOTTERY_INFO)):
+            if os.path.isfile(LOTTERY_INFO[i]['path local']):
+                db.import_csv(LOTTERY_INFO[i]['name'], LOTTERY_INFO[i]['path local'])
+            else:
+                print(f"Local file {LOTTERY_INFO[i]['path local']} not found.  Skipping.")
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_export.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Export the numbers behind the charts as flat files:  main ball counts,
+    special ball counts and ranks for each date range of a list or of a
+    rolling schedule, as CSV or JSON Lines.
+    Rows are streamed through generators (schedule -> chunks -> summaries ->
+    writer) so memory stays bounded by the chunk size, and chunks can be
+    summarized by a pool of worker processes reading the draw arrays and
+    cumulative counts from shared memory (lottery_shm.py).
+    Usage examples:
+        python3 lottery_export.py --game Powerball --every-draw -o draws.csv
+        python3 lottery_export.py --game Powerball --rolling 100 --step 10 --format jsonl -o rolling.jsonl --workers 4
+        python3 lottery_export.py --game 'Mega Millions' --range 2020-01-01:2020-12-31 --range 2021-01-01:2021-12-31 -o years.csv
+@references:
+    concurrent.futures:  https://docs.python.org/3/library/concurrent.futures.html
+    JSON Lines:  https://jsonlines.org/
+    csv:  https://docs.python.org/3/library/csv.html
+"""
+
+import sys
+import csv
+import json
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import numpy as np
+import pandas as pd
+import debug as dbg
+import lottery_analysis as la
+import lottery_shm as lshm
+
+#############
+# CONSTANTS #
+#############
+EXPORT_CHUNK_SIZE = 500
+EXPORT_FORMATS = ['csv', 'jsonl']
+
+#############
+# FUNCTIONS #
+#############
+def listRanges(store, date_pairs):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    date_pairs : iterable of (startDate, endDate), both inclusive.
+
+    Yields
+    ------
+    (i0, i1) row offsets of each date range.
+
+    """
+    for (startDate, endDate) in date_pairs:
+        yield store.row_range(pd.Timestamp(startDate), pd.Timestamp(endDate))
+
+def readRangesFile(fh):
+    """
+    Parameters
+    ----------
+    fh : text file object with start,end dates per line; blank lines,
+         lines starting with '#' and a header line before the first range
+         are skipped.
+
+    Returns
+    -------
+    list of (startDate, endDate) Timestamps.
+
+    Raises
+    ------
+    ValueError naming the line of a row that is not two dates.
+
+    """
+    pairs = []
+    reader = csv.reader(fh)
+    first = True
+    for row in reader:
+        fields = [x.strip() for x in row]
+        if not any(fields) or fields[0].startswith('#'):
+            continue
+        if len(fields) != 2:
+            raise ValueError(f"line {reader.line_num}:  expected 2 fields (start,end), found {len(fields)}")
+        pair = [pd.to_datetime(x, errors='coerce') if x else pd.NaT for x in fields]
+        if first and pd.isna(pair[0]) and pd.isna(pair[1]):
+            # header line, e.g. start,end
+            first = False
+            continue
+        if pd.isna(pair[0]) or pd.isna(pair[1]):
+            raise ValueError(f"line {reader.line_num}:  not a date range '{','.join(fields)}'")
+        first = False
+        pairs.append(tuple(pair))
+    return pairs
+
+def rollingRanges(n_draws, window, step=1):
+    """
+    Parameters
+    ----------
+    n_draws : number of draws in history.
+    window : draws per range.
+    step : draws between ends of consecutive ranges.
+
+    Yields
+    ------
+    (i0, i1) row offsets of each full window, oldest first
+    (window=1 gives every draw date).
+
+    """
+    for i1 in range(window, n_draws + 1, step):
+        yield (i1 - window, i1)
+
+def chunked(iterable, size):
+    """
+    Yields
+    ------
+    lists of up to size items of iterable.
+
+    """
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+def summarizeChunk(chunk, store=None, cum=None):
+    """
+    Parameters
+    ----------
+    chunk : list of (i0, i1) row offsets.
+    store, cum : DrawStore and [main, special] cumulative counts; default
+                 to the shared arrays attached by lottery_shm.attachWorker().
+
+    Returns
+    -------
+    list of summary dictionaries, one per range; ball lists start at ball 1.
+
+    """
+    if store is None:
+        (store, cum) = lshm._worker_arrays
+    i0 = np.array([r[0] for r in chunk])
+    i1 = np.array([r[1] for r in chunk])
+    # skip column 0 (balls outside current ball range)
+    balls = la.rangeCounts(cum[0], i0, i1)[:, 1:]
+    special = la.rangeCounts(cum[1], i0, i1)[:, 1:]
+    balls_rank = la.ballRanks(balls)
+    special_rank = la.ballRanks(special)
+    dates = store.dates
+    rows = []
+    for k in range(len(chunk)):
+        empty = i1[k] <= i0[k]
+        rows.append({'start': "" if empty else f"{dates[i0[k]]}",
+                     'end': "" if empty else f"{dates[i1[k] - 1]}",
+                     'draws': int(i1[k] - i0[k]),
+                     'balls': balls[k].tolist(),
+                     'special': special[k].tolist(),
+                     'balls_rank': balls_rank[k].tolist(),
+                     'special_rank': special_rank[k].tolist()})
+    return rows
+
+def summaryRows(store, ranges, workers=1, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    ranges : iterable of (i0, i1) row offsets (may be a generator).
+    workers : number of worker processes (1 = summarize in this process).
+    chunk_size : ranges per chunk sent to a worker.
+
+    Yields
+    ------
+    summary dictionaries in the order of ranges; at most 2 chunks per
+    worker are in flight, so memory does not grow with the schedule.
+
+    """
+    dbg.debug_output(f"summaryRows({store}, workers={workers})", color_fg='black', color_bg='cyan')
+    if workers <= 1:
+        cum = [la.cumulativeCounts(store, special=False), la.cumulativeCounts(store, special=True)]
+        for chunk in chunked(ranges, chunk_size):
+            yield from summarizeChunk(chunk, store, cum)
+        return
+
+    # arrays published once; workers attach by name
+    with lshm.SharedDrawArrays(store) as shared, ProcessPoolExecutor(max_workers=workers, initializer=lshm.attachWorker, initargs=(shared.spec,)) as executor:
+        pending = deque()
+        for chunk in chunked(ranges, chunk_size):
+            pending.append(executor.submit(summarizeChunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def writeCSV(rows, fh, n_balls, n_special):
+    """
+    Write summary rows as CSV with one column per ball count and rank.
+
+    Returns
+    -------
+    number of rows written.
+
+    """
+    writer = csv.writer(fh)
+    writer.writerow(['start', 'end', 'draws'] +
+                    [f"ball_{b}" for b in range(1, n_balls + 1)] +
+                    [f"special_{b}" for b in range(1, n_special + 1)] +
+                    [f"rank_ball_{b}" for b in range(1, n_balls + 1)] +
+                    [f"rank_special_{b}" for b in range(1, n_special + 1)])
+    count = 0
+    for row in rows:
+        writer.writerow([row['start'], row['end'], row['draws']] +
+                        row['balls'] + row['special'] + row['balls_rank'] + row['special_rank'])
+        count += 1
+    return count
+
+def writeJSONL(rows, fh):
+    """
+    Write summary rows as JSON Lines (one JSON object per line).
+
+    Returns
+    -------
+    number of rows written.
+
+    """
+    count = 0
+    for row in rows:
+        fh.write(json.dumps(row) + "\n")
+        count += 1
+    return count
+
+def exportSummaries(store, ranges, fh, fmt='csv', workers=1, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    ranges : iterable of (i0, i1) row offsets.
+    fh : text file object to write to.
+    fmt : 'csv' or 'jsonl'.
+    workers : number of worker processes.
+    chunk_size : ranges per chunk.
+
+    Returns
+    -------
+    number of rows written.
+
+    """
+    rows = summaryRows(store, ranges, workers, chunk_size)
+    if fmt == 'csv':
+        return writeCSV(rows, fh, la.ballBins(store.info) - 1, la.ballBins(store.info, special=True) - 1)
+    return writeJSONL(rows, fh)
+
+#################
+# MAIN APP CODE #
+#################
+
+if __name__=='__main__':
+    from Lottery_Summary import Chart_Options, loadLotteryData
+
+    parser = argparse.ArgumentParser(description="Export per-range ball counts and ranks.")
+    parser.add_argument('--game', default='Powerball', help="lottery name")
+    parser.add_argument('--source', default='Local', choices=['Local', 'Internet', 'Database', 'Directory'], help="data source")
+    parser.add_argument('--range', action='append', default=[], metavar='START:END', help="date range (YYYY-MM-DD:YYYY-MM-DD); repeatable")
+    parser.add_argument('--ranges-file', help="CSV file with start,end date per line")
+    parser.add_argument('--rolling', type=int, metavar='N', help="every window of N draws")
+    parser.add_argument('--step', type=int, default=1, help="draws between rolling windows")
+    parser.add_argument('--every-draw', action='store_true', help="one row per draw date")
+    parser.add_argument('--format', default='csv', choices=EXPORT_FORMATS)
+    parser.add_argument('-o', '--output', required=True, help="output file")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes")
+    parser.add_argument('--chunk', type=int, default=EXPORT_CHUNK_SIZE, help="ranges per chunk")
+    args = parser.parse_args()
+
+    options = Chart_Options()
+    options.name = args.game
+    options.dataSource = args.source
+    options.saveData = False
+    lot = loadLotteryData(options)
+
+    # build schedule of ranges lazily
+    if args.every_draw:
+        ranges = rollingRanges(len(lot.store), 1)
+    elif args.rolling:
+        ranges = rollingRanges(len(lot.store), args.rolling, args.step)
+    else:
+        pairs = [r.split(':') for r in args.range]
+        if args.ranges_file:
+            with open(args.ranges_file, newline='') as f:
+                try:
+                    pairs += readRangesFile(f)
+                except ValueError as e:
+                    parser.error(f"--ranges-file {args.ranges_file}, {e}")
+        if not pairs:
+            print("No ranges selected; use --range, --ranges-file, --rolling or --every-draw.")
+            sys.exit(2)
+        ranges = listRanges(lot.store, pairs)
+
+    with open(args.output, 'w', newline='') as fh:
+        count = exportSummaries(lot.store, ranges, fh, args.format, args.workers, args.chunk)
+    print(f"Saved {count} rows to {args.output}")
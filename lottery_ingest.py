@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_ingest.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Streaming ingest of Texas Lottery draw history exports into a
+    draw_store.DrawStore.  The file is read in fixed-size chunks keeping only
+    the date and ball columns as compact dtypes, and each chunk is written
+    straight into growable numpy arrays, so peak memory is bounded by the
+    chunk size plus the compact arrays themselves.
+    A directory or glob of exports (several states' copies, yearly archives)
+    is parsed in parallel by a process pool, merged and de-duplicated by draw
+    date; parsed arrays are cached per file so only changed files are re-read.
+    DrawFileTail follows a growing export and parses only appended rows.
+@references:
+    pandas read_csv chunksize / usecols / dtype:  https://pandas.pydata.org/docs/reference/api/pandas.read_csv.html
+    Numpy datetime64:  https://numpy.org/doc/stable/reference/arrays.datetime.html
+    Dynamic array growth:  https://en.wikipedia.org/wiki/Dynamic_array#Geometric_expansion_and_amortized_cost
+    glob:  https://docs.python.org/3/library/glob.html
+    Numpy savez:  https://numpy.org/doc/stable/reference/generated/numpy.savez.html
+"""
+
+import os
+import io
+import glob
+import time
+import hashlib
+from urllib.parse import urlparse
+from urllib.request import urlopen
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import debug as dbg
+from draw_store import DrawStore, N_BALLS
+
+#############
+# CONSTANTS #
+#############
+INGEST_CHUNK_SIZE = 10000
+INGEST_INITIAL_CAPACITY = 4096
+# parsed arrays of each source file, reused while file size, mtime and cache version match
+INGEST_CACHE_DIR = '.ingest_cache'
+# note:  version 2 keeps the first line of exports without a header
+INGEST_CACHE_VERSION = 2
+# leading bytes of a followed file hashed to notice it was rewritten
+TAIL_HEAD_BYTES = 4096
+
+# Texas Lottery export column format:
+# ['Game Name', 'Month', 'Day', 'Year', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special', 'Multiplier']
+CSV_COLUMN_NAMES = ['Game Name', 'Month', 'Day', 'Year', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special', 'Multiplier']
+CSV_USECOLS = ['Month', 'Day', 'Year', 'Num1', 'Num2', 'Num3', 'Num4', 'Num5', 'Special']
+CSV_DTYPES = {'Month': np.uint8, 'Day': np.uint8, 'Year': np.uint16,
+              'Num1': np.uint8, 'Num2': np.uint8, 'Num3': np.uint8,
+              'Num4': np.uint8, 'Num5': np.uint8, 'Special': np.uint8}
+
+#############
+# FUNCTIONS #
+#############
+def dayNumbers(year, month, day):
+    """
+    Parameters
+    ----------
+    year, month, day : integer arrays.
+
+    Returns
+    -------
+    int32 array of day numbers (days since 1970-01-01).
+
+    """
+    months = (np.asarray(year, dtype=np.int64) - 1970) * 12 + (np.asarray(month, dtype=np.int64) - 1)
+    first_of_month = months.astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+    return (first_of_month + np.asarray(day, dtype=np.int64) - 1).astype(np.int32)
+
+def fetchSource(source):
+    """
+    Parameters
+    ----------
+    source : local path, URL or file object of a Texas Lottery export.
+
+    Returns
+    -------
+    source, or for a URL a file object of the downloaded bytes (header
+    sniffing and parsing then read one download).
+
+    """
+    if isinstance(source, str) and urlparse(source).scheme in ('http', 'https', 'ftp'):
+        with urlopen(source) as response:
+            return io.BytesIO(response.read())
+    return source
+
+def hasHeader(source):
+    """
+    Parameters
+    ----------
+    source : local path, URL or file object of a Texas Lottery export.
+
+    Returns
+    -------
+    True if the first line is a header (Game Name field a number or Month
+    field not a number).
+
+    """
+    # note:  exports of the Texas Lottery have no header, files saved by
+    #        DataFrame.to_csv have one (column names or column numbers)
+    pos = source.tell() if hasattr(source, 'seek') else None
+    try:
+        first = pd.read_csv(source, header=None, names=CSV_COLUMN_NAMES, usecols=['Game Name', 'Month'], dtype=str, nrows=1)
+    except pd.errors.EmptyDataError:
+        return False
+    finally:
+        if pos is not None:
+            source.seek(pos)
+    if len(first) == 0:
+        return False
+    (game, month) = (str(first['Game Name'].iloc[0]).strip(), str(first['Month'].iloc[0]).strip())
+    return game.isdigit() or not month.isdigit()
+
+def readChunks(source, chunk_size=INGEST_CHUNK_SIZE, skiprows=None):
+    """
+    Parameters
+    ----------
+    source : local path, URL or file object of a Texas Lottery export.
+    chunk_size : rows per chunk.
+    skiprows : lines skipped at start (None = 1 if first line is a header, else 0).
+
+    Yields
+    ------
+    (balls, days) per chunk:  uint8 array (k, 6) and int32 day numbers (k,).
+
+    """
+    if skiprows is None:
+        source = fetchSource(source)
+        skiprows = int(hasHeader(source))
+    reader = pd.read_csv(source, header=None, skiprows=skiprows, names=CSV_COLUMN_NAMES,
+                         usecols=CSV_USECOLS, dtype=CSV_DTYPES, chunksize=chunk_size)
+    for df_chunk in reader:
+        balls = df_chunk[CSV_USECOLS[3:]].to_numpy(dtype=np.uint8)
+        days = dayNumbers(df_chunk['Year'].to_numpy(), df_chunk['Month'].to_numpy(), df_chunk['Day'].to_numpy())
+        yield balls, days
+
+def readDrawsChunked(source, info, chunk_size=INGEST_CHUNK_SIZE):
+    """
+    Parameters
+    ----------
+    source : local path, URL or file object of a Texas Lottery export.
+    info : LOTTERY_INFO entry of the game.
+    chunk_size : rows per chunk.
+
+    Returns
+    -------
+    DrawStore with all draws of source, sorted by date.
+
+    """
+    dbg.debug_output(f"readDrawsChunked({source}, chunk_size={chunk_size})", color_fg='black', color_bg='cyan')
+    t_start = time.perf_counter()
+    builder = DrawArrayBuilder(info)
+    for balls, days in readChunks(source, chunk_size):
+        builder.append(balls, days)
+    store = builder.finish()
+    t = time.perf_counter() - t_start
+    dbg.debug_output(f"readDrawsChunked:  {len(store)} rows in {t:.3f} s ({len(store) / max(t, 1e-9):,.0f} rows/s)", color_fg='black', color_bg='cyan')
+    return store
+
+def expandSources(pattern):
+    """
+    Parameters
+    ----------
+    pattern : directory (all *.csv files in it), glob pattern or file path.
+
+    Returns
+    -------
+    sorted list of file paths.
+
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.csv')
+    return sorted(glob.glob(pattern))
+
+def cachePath(path, cache_dir):
+    # one cache file per absolute source path
+    key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}.npz")
+
+def readFileCached(path, cache_dir=INGEST_CACHE_DIR, chunk_size=INGEST_CHUNK_SIZE):
+    """
+    Parameters
+    ----------
+    path : local file path of a Texas Lottery export.
+    cache_dir : directory of cached arrays (None = no cache).
+    chunk_size : rows per chunk.
+
+    Returns
+    -------
+    (balls, days, cached):  uint8 array (n, 6), int32 day numbers (n,) in
+    file order, and True if read from cache.
+
+    """
+    st = os.stat(path)
+    if cache_dir is not None:
+        cache_file = cachePath(path, cache_dir)
+        if os.path.isfile(cache_file):
+            with np.load(cache_file) as cached:
+                version = int(cached['version']) if 'version' in cached.files else 1
+                if version == INGEST_CACHE_VERSION and int(cached['size']) == st.st_size and int(cached['mtime_ns']) == st.st_mtime_ns:
+                    return cached['balls'], cached['days'], True
+
+    chunks = list(readChunks(path, chunk_size))
+    balls = np.concatenate([c[0] for c in chunks]) if chunks else np.empty((0, N_BALLS + 1), dtype=np.uint8)
+    days = np.concatenate([c[1] for c in chunks]) if chunks else np.empty(0, dtype=np.int32)
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to temporary name first so concurrent readers never see partial files
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_file, balls=balls, days=days, size=st.st_size, mtime_ns=st.st_mtime_ns, version=INGEST_CACHE_VERSION)
+        os.replace(tmp_file, cache_file)
+    return balls, days, False
+
+def readFileTask(args):
+    # process pool task:  (path, cache_dir, chunk_size) -> readFileCached result
+    return readFileCached(*args)
+
+def mergeDraws(info, parts):
+    """
+    Parameters
+    ----------
+    info : LOTTERY_INFO entry of the game.
+    parts : list of (balls, days) arrays; earlier parts win on duplicate dates.
+
+    Returns
+    -------
+    (DrawStore sorted by date with one draw per date, number of duplicate
+    dates dropped, number of those with different balls).
+
+    """
+    if not parts:
+        return DrawStore(info), 0, 0
+    balls = np.concatenate([p[0] for p in parts])
+    days = np.concatenate([p[1] for p in parts])
+    order = np.argsort(days, kind='stable')
+    (balls, days) = (balls[order], days[order])
+    # first row of each date (stable sort keeps part order within a date)
+    first = np.ones(len(days), dtype=bool)
+    first[1:] = days[1:] != days[:-1]
+    # duplicates that disagree with the kept draw of their date
+    kept_row = np.cumsum(first) - 1
+    kept_balls = balls[first]
+    conflicts = int(np.any(balls[~first] != kept_balls[kept_row[~first]], axis=1).sum())
+    store = DrawStore(info, np.ascontiguousarray(kept_balls), np.ascontiguousarray(days[first]))
+    return store, int((~first).sum()), conflicts
+
+def readDrawSources(pattern, info, workers=None, cache_dir=INGEST_CACHE_DIR, chunk_size=INGEST_CHUNK_SIZE):
+    """
+    Parameters
+    ----------
+    pattern : directory, glob pattern or file path of exports of one game.
+    info : LOTTERY_INFO entry of the game.
+    workers : worker processes (None = number of CPUs, 1 = this process).
+    cache_dir : directory of cached arrays (None = no cache).
+    chunk_size : rows per chunk.
+
+    Returns
+    -------
+    DrawStore with draws of all files, sorted and de-duplicated by date.
+
+    """
+    dbg.debug_output(f"readDrawSources({pattern}, workers={workers})", color_fg='black', color_bg='cyan')
+    t_start = time.perf_counter()
+    paths = expandSources(pattern)
+    tasks = [(path, cache_dir, chunk_size) for path in paths]
+    if workers == 1 or len(paths) <= 1:
+        results = [readFileTask(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(readFileTask, tasks))
+
+    (store, n_duplicates, n_conflicts) = mergeDraws(info, [(r[0], r[1]) for r in results])
+    n_cached = sum(r[2] for r in results)
+    t = time.perf_counter() - t_start
+    dbg.debug_output(f"readDrawSources:  {len(paths)} files ({n_cached} cached), {len(store)} draws, {n_duplicates} duplicate dates dropped ({n_conflicts} with different balls) in {t:.3f} s", color_fg='black', color_bg='cyan')
+    return store
+
+#############
+# CLASSES   #
+#############
+class DrawArrayBuilder():
+    """
+    Growable arrays of draws; capacity doubles when full, so appending n
+    rows costs amortized O(n) copies.
+
+    Examples
+    --------
+        builder = DrawArrayBuilder(info)
+        for balls, days in readChunks('Powerball/Powerball.csv'):
+            builder.append(balls, days)
+        store = builder.finish()
+    """
+    __slots__ = ('info', 'draws', 'days', 'n')
+
+    def __init__(self, info, capacity=INGEST_INITIAL_CAPACITY):
+        self.info = info
+        self.draws = np.empty((capacity, N_BALLS + 1), dtype=np.uint8)
+        self.days = np.empty(capacity, dtype=np.int32)
+        self.n = 0
+
+    def reserve(self, capacity):
+        if capacity <= len(self.days):
+            return
+        capacity = max(capacity, 2 * len(self.days))
+        draws = np.empty((capacity, N_BALLS + 1), dtype=np.uint8)
+        days = np.empty(capacity, dtype=np.int32)
+        draws[:self.n] = self.draws[:self.n]
+        days[:self.n] = self.days[:self.n]
+        (self.draws, self.days) = (draws, days)
+
+    def append(self, balls, days):
+        k = len(days)
+        self.reserve(self.n + k)
+        self.draws[self.n:self.n + k] = balls
+        self.days[self.n:self.n + k] = days
+        self.n += k
+
+    def finish(self):
+        """
+        Returns
+        -------
+        DrawStore of appended draws sorted by date (arrays trimmed to size).
+
+        """
+        draws = self.draws[:self.n]
+        days = self.days[:self.n]
+        if self.n > 1 and np.all(days[1:] >= days[:-1]):
+            # already sorted:  keep rows, drop unused capacity
+            return DrawStore(self.info, draws.copy(), days.copy())
+        return DrawStore.from_arrays(self.info, draws, days)
+
+class DrawFileTail():
+    """
+    Follows a local export that grows by appended rows; read_new() parses
+    only complete lines written since the last call.  The file counts as
+    replaced when it shrank, its device or inode changed (new file renamed
+    over it) or its first bytes already read changed (rewritten in place).
+
+    Examples
+    --------
+        tail = DrawFileTail('Powerball/Powerball.csv')
+        ...
+        new = tail.read_new()
+        if new is not None and len(new[1]):
+            store.extend(*new)
+    """
+    __slots__ = ('path', 'offset', 'size', 'mtime_ns', 'file_id', 'head')
+
+    def __init__(self, path, offset=None):
+        # default:  follow from current end of file (rows already loaded)
+        self.path = path
+        st = os.stat(path)
+        self.offset = st.st_size if offset is None else offset
+        (self.size, self.mtime_ns, self.file_id) = (st.st_size, st.st_mtime_ns, (st.st_dev, st.st_ino))
+        self.head = self.head_digest()
+
+    def head_digest(self):
+        # (length, hash) of leading bytes already read (up to TAIL_HEAD_BYTES)
+        n = min(self.offset, TAIL_HEAD_BYTES)
+        with open(self.path, 'rb') as f:
+            return (n, hashlib.sha1(f.read(n)).digest())
+
+    def changed(self):
+        st = os.stat(self.path)
+        return (st.st_size, st.st_mtime_ns, (st.st_dev, st.st_ino)) != (self.size, self.mtime_ns, self.file_id)
+
+    def read_new(self):
+        """
+        Returns
+        -------
+        (balls, days) of complete rows appended since last call (empty
+        arrays if none), or None if the file shrank or was replaced (whole
+        file must be read again).
+
+        """
+        empty = (np.empty((0, N_BALLS + 1), dtype=np.uint8), np.empty(0, dtype=np.int32))
+        with open(self.path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            (self.size, self.mtime_ns) = (st.st_size, st.st_mtime_ns)
+            head = (self.head[0], hashlib.sha1(f.read(self.head[0])).digest())
+            if st.st_size < self.offset or (st.st_dev, st.st_ino) != self.file_id or head != self.head:
+                # follow the new file from its end
+                (self.offset, self.file_id) = (st.st_size, (st.st_dev, st.st_ino))
+                self.head = self.head_digest()
+                return None
+            if st.st_size == self.offset:
+                return empty
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+        # keep a partly written last line for the next call
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return empty
+        self.offset += end
+        if self.head[0] < TAIL_HEAD_BYTES:
+            self.head = self.head_digest()
+        chunks = list(readChunks(io.BytesIO(data[:end]), INGEST_CHUNK_SIZE, skiprows=0))
+        if not chunks:
+            return empty
+        return np.concatenate([c[0] for c in chunks]), np.concatenate([c[1] for c in chunks])
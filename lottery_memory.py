@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_memory.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Opt-in memory profiling of load and chart phases.
+    While a Memory_Profiler is started, every phase (a with phase(name):
+    block or a function decorated with @profiled(name)) records
+    python allocations traced by tracemalloc (peak and net change, top
+    allocation sites from snapshot differences), the change in number of
+    live python objects (e.g. chart artists piling up) and process RSS.
+    Phases may be nested; a phase's peak includes the peaks of its inner
+    phases.  Allocations are traced only while a phase is open (tracing
+    slows python code several times), so memory allocated before a phase
+    and freed in it does not show as a negative change.  When no profiler
+    is started phases cost one global lookup.
+    A budget in MB fails the run when the process RSS high-water mark goes
+    over it, naming the first phase that crossed it.
+    Usage example:
+        python3 Lottery_Summary.py --memory-profile --memory-budget 400
+        python3 Lottery_Summary.py --export-playback run.gif --memory-profile --memory-budget 400
+@references:
+    tracemalloc:  https://docs.python.org/3/library/tracemalloc.html
+    resource getrusage:  https://docs.python.org/3/library/resource.html#resource.getrusage
+    /proc/self/statm:  https://man7.org/linux/man-pages/man5/proc.5.html
+"""
+
+import os
+import gc
+import sys
+import functools
+import contextlib
+import tracemalloc
+import debug as dbg
+try:
+    import resource
+except ImportError:
+    # note:  not available on Windows; RSS high-water mark then from samples
+    resource = None
+
+#############
+# CONSTANTS #
+#############
+MB = 2**20
+# allocation sites listed per phase and stack frames kept per allocation
+MEMORY_TOP_SITES = 10
+MEMORY_TRACE_FRAMES = 1
+# frames of the profiler itself are not counted as allocation sites
+MEMORY_IGNORE_FILES = [tracemalloc.__file__, __file__, '<frozen importlib._bootstrap>', '<frozen importlib._bootstrap_external>', '<unknown>']
+
+# profiler of this process, set by startProfiler()
+_profiler = None
+
+#############
+# FUNCTIONS #
+#############
+def rssBytes():
+    """
+    Returns
+    -------
+    resident set size of this process in bytes (0 if unknown).
+
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return peakRssBytes()
+
+def peakRssBytes():
+    """
+    Returns
+    -------
+    RSS high-water mark of this process in bytes (0 if unknown).
+
+    """
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # note:  kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def startProfiler(budget_mb=0, top=MEMORY_TOP_SITES, frames=MEMORY_TRACE_FRAMES):
+    """
+    Start profiling phases of this process.
+
+    Returns
+    -------
+    Memory_Profiler.
+
+    """
+    global _profiler
+    _profiler = Memory_Profiler(budget_mb, top, frames)
+    return _profiler
+
+def stopProfiler():
+    """
+    Stop profiling and print the report.
+
+    Returns
+    -------
+    True if within budget (or no profiler started).
+
+    """
+    global _profiler
+    if _profiler is None:
+        return True
+    profiler = _profiler
+    _profiler = None
+    profiler.stop()
+    profiler.report()
+    return profiler.within_budget()
+
+def phase(name):
+    """
+    Returns
+    -------
+    context manager recording phase name when profiling, else a no-op.
+
+    """
+    return _profiler.phase(name) if _profiler is not None else contextlib.nullcontext()
+
+def profiled(name):
+    """
+    Decorator recording each call of a function as phase name.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return fn(*args, **kwargs)
+            with _profiler.phase(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+#############
+# CLASSES   #
+#############
+class Memory_Profiler():
+    """
+    Per-phase memory statistics of this process.
+
+    Attributes
+    ----------
+    phases : dictionary by phase name (in order first seen) of calls,
+             peak (most python bytes allocated above phase start), net
+             (python bytes kept after all calls), objects (live objects
+             added), rss and rss_peak (bytes after last call) and sites
+             (allocation site -> bytes kept).
+    over_budget : first phase after which the RSS high-water mark was
+                  over budget (None = within budget).
+    """
+    def __init__(self, budget_mb=0, top=MEMORY_TOP_SITES, frames=MEMORY_TRACE_FRAMES):
+        """
+        Parameters
+        ----------
+        budget_mb : RSS budget in MB (0 = none).
+        top : allocation sites listed per phase.
+        frames : stack frames kept per traced allocation.
+
+        """
+        dbg.debug_output(f"Memory_Profiler(budget_mb={budget_mb})", color_fg='black', color_bg='yellow')
+        self.budget = budget_mb * MB
+        self.top = top
+        self.phases = {}
+        self.over_budget = None
+        self.rss_start = rssBytes()
+        # open phases:  [name, start snapshot, traced at start, highest peak of inner phases, objects at start]
+        self.stack = []
+        self.frames = frames
+        # trace only during outermost phases unless tracing was already on
+        self.owns_tracing = not tracemalloc.is_tracing()
+
+    def __repr__(self):
+        return f"Memory_Profiler({len(self.phases)} phases, budget {self.budget // MB} MB)"
+
+    def snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, f) for f in MEMORY_IGNORE_FILES])
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if self.owns_tracing and not self.stack:
+            tracemalloc.start(self.frames)
+        # note:  start snapshot taken before reading traced memory, so its
+        #        own size cancels out of the net change
+        start = self.snapshot()
+        objects = len(gc.get_objects())
+        # peak of enclosing phase so far (counter is reset for this phase)
+        (traced, peak) = tracemalloc.get_traced_memory()
+        if self.stack:
+            self.stack[-1][3] = max(self.stack[-1][3], peak)
+        entry = [name, start, traced, 0, objects]
+        self.stack.append(entry)
+        tracemalloc.reset_peak()
+        try:
+            yield self
+        finally:
+            (traced, peak) = tracemalloc.get_traced_memory()
+            peak = max(peak, entry[3])
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1][3] = max(self.stack[-1][3], peak)
+            self.record(entry, self.snapshot(), traced, peak)
+            if self.owns_tracing and not self.stack:
+                tracemalloc.stop()
+
+    def record(self, entry, snapshot, traced, peak):
+        (name, start, traced_start, _, objects_start) = entry
+        stats = self.phases.setdefault(name, {'calls': 0, 'peak': 0, 'net': 0, 'objects': 0, 'rss': 0, 'rss_peak': 0, 'sites': {}})
+        stats['calls'] += 1
+        stats['peak'] = max(stats['peak'], peak - traced_start)
+        stats['net'] += traced - traced_start
+        stats['objects'] += len(gc.get_objects()) - objects_start
+        stats['rss'] = rssBytes()
+        stats['rss_peak'] = max(peakRssBytes(), stats['rss'])
+        for diff in snapshot.compare_to(start, 'lineno'):
+            if diff.size_diff:
+                site = f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}"
+                stats['sites'][site] = stats['sites'].get(site, 0) + diff.size_diff
+        if self.budget and self.over_budget is None and stats['rss_peak'] > self.budget:
+            self.over_budget = name
+            dbg.debug_output(f"Memory_Profiler:  RSS {stats['rss_peak'] / MB:.1f} MB over budget {self.budget / MB:.0f} MB after {name}", color_fg='white', color_bg='red')
+
+    def within_budget(self):
+        return self.over_budget is None
+
+    def stop(self):
+        if self.owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def report(self):
+        """
+        Print per-phase table and top allocation sites.
+
+        Returns
+        -------
+        None.
+
+        """
+        print(f"== Memory by phase (RSS at start {self.rss_start / MB:.1f} MB) ==")
+        print(f"{'phase':<28s}{'calls':>7s}{'peak MB':>10s}{'net MB':>10s}{'objects':>10s}{'RSS MB':>10s}{'RSS max MB':>12s}")
+        for (name, s) in self.phases.items():
+            print(f"{name:<28s}{s['calls']:>7d}{s['peak'] / MB:>10.2f}{s['net'] / MB:>10.2f}{s['objects']:>10d}{s['rss'] / MB:>10.1f}{s['rss_peak'] / MB:>12.1f}")
+        for (name, s) in self.phases.items():
+            sites = sorted(s['sites'].items(), key=lambda kv: -abs(kv[1]))[:self.top]
+            if not sites:
+                continue
+            print(f"-- {name}:  top allocation sites (bytes kept over {s['calls']} calls) --")
+            for (site, size) in sites:
+                print(f"{size / 1024:>12,.1f} KiB  {site}")
+        if self.budget:
+            if self.over_budget is None:
+                print(f"RSS high-water mark {peakRssBytes() / MB:.1f} MB within budget {self.budget / MB:.0f} MB")
+            else:
+                print(f"RSS high-water mark {peakRssBytes() / MB:.1f} MB over budget {self.budget / MB:.0f} MB (first after phase {self.over_budget})")
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_scan.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Hot and cold streak scanner:  scores every contiguous range of at least
+    a minimum number of draws for every ball, and returns the ranges where a
+    ball was drawn most above (hot) or below (cold) its expected count.
+    Counts of all ranges come from the cumulative count matrix
+    (lottery_analysis.cumulativeCounts); ranges are scored in blocks of end
+    draws so memory stays bounded, and blocks can be scored by a pool of
+    worker processes.
+    Score of ball b over a range drawn c times:
+        z = (c - sum L_e p_e) / sqrt(sum L_e p_e (1 - p_e))
+    with L_e = draws of the range in rule era e in which b was in the pool
+    and p_e = chance of b in one draw of era e (5 / number of main balls or
+    1 / number of special balls of the era).  Expected counts and variances
+    are prefix sums over draws like the counts; ranges in which a ball was
+    never in the pool are skipped for that ball, so balls added to the pool
+    by a rule change do not show up as cold.
+    Usage example:
+        python3 lottery_scan.py --game Powerball --min-draws 100 --top 10 --workers 4
+@references:
+    Prefix sums:  https://en.wikipedia.org/wiki/Prefix_sum
+    Binomial distribution:  https://en.wikipedia.org/wiki/Binomial_distribution
+    Standard score:  https://en.wikipedia.org/wiki/Standard_score
+    concurrent.futures:  https://docs.python.org/3/library/concurrent.futures.html
+"""
+
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import debug as dbg
+import lottery_analysis as la
+import lottery_shm as lshm
+from draw_store import N_BALLS
+
+#############
+# CONSTANTS #
+#############
+# count cells (ranges x balls) scored at once; bounds memory of one block
+SCAN_MAX_CELLS = 2**22
+SCAN_TOP_K = 10
+SCAN_MIN_DRAWS = 50
+
+#############
+# FUNCTIONS #
+#############
+def drawChance(info, special=False):
+    """
+    Returns
+    -------
+    float array (eras,) of chance of one given ball in one draw in each
+    rule era (lottery_analysis.gameEras).
+
+    """
+    k = 1 if special else N_BALLS
+    return np.array([k / (max(e['special range'] if special else e['balls range']) - 1) for e in la.gameEras(info)])
+
+def scanState(store, special=False):
+    """
+    Returns
+    -------
+    dictionary of arrays shared by all blocks of one scan:  'cum'
+    cumulative counts (cumulativeCounts()), 'mean' and 'var' float32
+    arrays (draws + 1, balls) of expected count and variance of each
+    ball's count in rows 0 to t-1 (0 for draws in which the ball was not
+    in the pool of the draw's rule era).
+
+    """
+    p = drawChance(store.info, special)[:, None] * la.eraPools(store.info, special)
+    rows_per_era = np.diff(la.eraIndex(store))
+    state = {'cum': la.cumulativeCounts(store, special)}
+    for (key, per_draw) in (('mean', p), ('var', p * (1 - p))):
+        prefix = np.zeros((len(store) + 1, p.shape[1]), dtype=np.float32)
+        prefix[1:] = np.cumsum(np.repeat(per_draw, rows_per_era, axis=0), axis=0)
+        state[key] = prefix
+    return state
+
+def endBlocks(n_draws, min_draws, n_balls, max_cells=SCAN_MAX_CELLS):
+    """
+    Yields
+    ------
+    (e0, e1) blocks of range ends; ranges ending at e0+1 to e1 are scored
+    together, in at most about max_cells count cells.
+
+    """
+    size = max(1, max_cells // max(1, n_draws * n_balls))
+    for e0 in range(min_draws - 1, n_draws, size):
+        yield (e0, min(e0 + size, n_draws))
+
+def scoreBlock(block, min_draws, state=None):
+    """
+    Parameters
+    ----------
+    block : (e0, e1) block of range ends from endBlocks().
+    min_draws : minimum draws per range.
+    state : scanState(); defaults to the worker process state set by
+            lottery_shm.initWorkerState().
+
+    Returns
+    -------
+    (hot, cold) of the block; each a tuple of arrays (balls,) per ball:
+    (z, i0, i1, count) of its highest (hot) or lowest (cold) scoring range
+    i0 to i1-1.
+
+    """
+    state = lshm.workerState(state)
+    (cum, mean, var) = (state['cum'], state['mean'], state['var'])
+    (e0, e1) = block
+    # range i0..i1-1 for i1 in ends and i0 in starts (skip column 0, out of pool)
+    ends = np.arange(e0 + 1, e1 + 1)
+    starts = np.arange(0, e1 - min_draws + 1)
+    counts = cum[ends, None, 1:] - cum[None, starts, 1:]
+    length = ends[:, None] - starts[None, :]
+    # z in place:  (counts - expected) / sd, float32 cells
+    z = counts.astype(np.float32)
+    z -= mean[ends, None] - mean[None, starts]
+    sd = var[ends, None] - var[None, starts]
+    # too short, or ball never in the pool in the range
+    invalid = ((length < min_draws)[:, :, None] | (sd <= 0)).reshape(-1, counts.shape[2])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.sqrt(sd, out=sd)
+        z /= sd
+    del sd
+    z = z.reshape(-1, counts.shape[2])
+    counts = counts.reshape(z.shape)
+
+    result = []
+    balls = np.arange(z.shape[1])
+    for (fill, pick) in ((-np.inf, np.argmax), (np.inf, np.argmin)):
+        z[invalid] = fill
+        k = pick(z, axis=0)
+        result.append((z[k, balls], starts[k % len(starts)], ends[k // len(starts)], counts[k, balls]))
+    return tuple(result)
+
+def mergeBlocks(best, block_result):
+    # keep higher hot and lower cold score of each ball
+    if best is None:
+        return block_result
+    merged = []
+    for (sign, a, b) in ((1, best[0], block_result[0]), (-1, best[1], block_result[1])):
+        take_b = sign * b[0] > sign * a[0]
+        merged.append(tuple(np.where(take_b, xb, xa) for (xa, xb) in zip(a, b)))
+    return tuple(merged)
+
+def scanHotStreaks(store, min_draws=SCAN_MIN_DRAWS, top_k=SCAN_TOP_K, special=False, direction='both', workers=1, max_cells=SCAN_MAX_CELLS):
+    """
+    Parameters
+    ----------
+    store : DrawStore.
+    min_draws : minimum draws per range.
+    top_k : number of ranges returned.
+    special : True for special balls, False for main balls.
+    direction : 'hot' (drawn more than expected), 'cold' (less) or 'both'.
+    workers : number of worker processes (1 = score in this process).
+    max_cells : count cells scored at once per block.
+
+    Returns
+    -------
+    list of up to top_k dictionaries sorted by |z|, at most one hot and one
+    cold range per ball:  ball, special, i0, i1 (rows i0 to i1-1), start,
+    end, draws, count, expected, z.
+
+    """
+    dbg.debug_output(f"scanHotStreaks({store}, min_draws={min_draws}, special={special}, workers={workers})", color_fg='black', color_bg='cyan')
+    t_start = time.perf_counter()
+    n = len(store)
+    if n < min_draws or min_draws < 1:
+        return []
+    state = scanState(store, special)
+    (cum, mean) = (state['cum'], state['mean'])
+    blocks = list(endBlocks(n, min_draws, cum.shape[1] - 1, max_cells))
+
+    best = None
+    if workers <= 1 or len(blocks) <= 1:
+        for block in blocks:
+            best = mergeBlocks(best, scoreBlock(block, min_draws, state))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=lshm.initWorkerState, initargs=(state,)) as executor:
+            for block_result in executor.map(scoreBlock, blocks, [min_draws] * len(blocks)):
+                best = mergeBlocks(best, block_result)
+
+    directions = {'hot': [best[0]], 'cold': [best[1]], 'both': [best[0], best[1]]}[direction]
+    dates = store.dates
+    rows = []
+    for (z, i0, i1, count) in directions:
+        for b in range(len(z)):
+            if not np.isfinite(z[b]):
+                continue
+            draws = int(i1[b] - i0[b])
+            rows.append({'ball': b + 1, 'special': special,
+                         'i0': int(i0[b]), 'i1': int(i1[b]),
+                         'start': f"{dates[i0[b]]}", 'end': f"{dates[i1[b] - 1]}",
+                         'draws': draws, 'count': int(count[b]),
+                         'expected': float(mean[i1[b], b] - mean[i0[b], b]), 'z': float(z[b])})
+    rows.sort(key=lambda r: -abs(r['z']))
+    t = time.perf_counter() - t_start
+    dbg.debug_output(f"scanHotStreaks:  {n * (n + 1) // 2 * (cum.shape[1] - 1):,d} (range, ball) pairs max in {len(blocks)} blocks in {t:.3f} s", color_fg='black', color_bg='cyan')
+    return rows[:top_k]
+
+def formatStreak(row):
+    """
+    Returns
+    -------
+    one line description of a scanHotStreaks() result.
+
+    """
+    ball = f"{'Special ' if row['special'] else ''}{row['ball']}"
+    return f"{ball:>10s}  {row['start']} - {row['end']}  {row['draws']:5d} draws  {row['count']:4d} x (exp. {row['expected']:6.1f})  z = {row['z']:+.2f}"
+
+#################
+# MAIN APP CODE #
+#################
+
+if __name__=='__main__':
+    from Lottery_Summary import Chart_Options, loadLotteryData
+
+    parser = argparse.ArgumentParser(description="Find date ranges where balls were drawn most above or below expectation.")
+    parser.add_argument('--game', default='Powerball', help="lottery name")
+    parser.add_argument('--source', default='Local', choices=['Local', 'Internet', 'Database', 'Directory'], help="data source")
+    parser.add_argument('--min-draws', type=int, default=SCAN_MIN_DRAWS, help="minimum draws per range")
+    parser.add_argument('--top', type=int, default=SCAN_TOP_K, help="number of ranges listed")
+    parser.add_argument('--direction', default='both', choices=['hot', 'cold', 'both'])
+    parser.add_argument('--special', action='store_true', help="scan special balls instead of main balls")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes")
+    args = parser.parse_args()
+
+    options = Chart_Options()
+    options.name = args.game
+    options.dataSource = args.source
+    options.saveData = False
+    lot = loadLotteryData(options)
+
+    for row in scanHotStreaks(lot.store, args.min_draws, args.top, args.special, args.direction, args.workers):
+        print(formatStreak(row))
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@file:  lottery_shm.py
+@author:  Kenneth R. Skillern, Jr.
+@license:  GPL-3.0 - GNU General Public License v3.0
+@date_creation:  10-19-2026
+@purpose:
+    Share the draw arrays of a game and their cumulative counts with worker
+    processes through one multiprocessing.shared_memory block.
+    The parent publishes the arrays once; workers receive only a small
+    picklable spec (block name, offsets, shapes, dtypes) and attach by name
+    to get zero-copy numpy views, instead of each worker parsing the CSV or
+    unpickling a DataFrame.
+    The publishing process owns the block:  it is unlinked when the
+    SharedDrawArrays is closed, leaves its with block, or is garbage
+    collected / the interpreter exits.  Workers only close their mapping.
+    Pools whose state is pickled once per worker instead (backtest, streak
+    scan) use initWorkerState() / workerState().
+    Usage example:
+        with SharedDrawArrays(store) as shared:
+            with ProcessPoolExecutor(initializer=attachWorker, initargs=(shared.spec,)) as executor:
+                ...
+        # in worker:  store, cum = _worker_arrays
+@references:
+    multiprocessing.shared_memory:  https://docs.python.org/3/library/multiprocessing.shared_memory.html
+    weakref.finalize:  https://docs.python.org/3/library/weakref.html#weakref.finalize
+"""
+
+import weakref
+from multiprocessing import shared_memory
+import numpy as np
+import debug as dbg
+import lottery_analysis as la
+from draw_store import DrawStore
+
+#############
+# CONSTANTS #
+#############
+# array start offsets in the block are multiples of this
+SHM_ALIGN = 64
+
+# per worker process state, set by attachWorker():  (DrawStore, [main, special] cumulative counts)
+_worker_arrays = None
+# shared memory mapping of worker process (kept open while views are used)
+_worker_shm = None
+# per worker process state passed by pickling (e.g. backtest or scan arrays), set by initWorkerState()
+_worker_state = None
+# published blocks unlinked while views of them were still referenced
+_unclosed = []
+
+#############
+# FUNCTIONS #
+#############
+def blockView(shm, offset, shape, dtype):
+    """
+    Returns
+    -------
+    numpy array viewing the block at offset.  The view holds its own
+    memoryview of the block, so the mapping cannot be closed under it
+    (close() raises BufferError while views exist).
+
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+    return np.frombuffer(shm.buf[offset:offset + nbytes], dtype=dtype).reshape(shape)
+
+def attachArrays(spec):
+    """
+    Parameters
+    ----------
+    spec : SharedDrawArrays.spec of the publishing process.
+
+    Returns
+    -------
+    (shm, arrays):  attached SharedMemory (keep a reference while arrays are
+    used, close() when done; never unlink) and dictionary of read-only
+    zero-copy numpy views by name.
+
+    """
+    # note:  pool workers share the resource tracker of the publishing
+    #        process, so attaching does not hand ownership to the worker
+    shm = shared_memory.SharedMemory(name=spec['name'])
+    arrays = {}
+    for (key, (offset, shape, dtype)) in spec['arrays'].items():
+        a = blockView(shm, offset, shape, dtype)
+        a.flags.writeable = False
+        arrays[key] = a
+    return shm, arrays
+
+def attachDrawStore(spec):
+    """
+    Returns
+    -------
+    (shm, store, cum):  attached SharedMemory, DrawStore and [main, special]
+    cumulative counts viewing the shared block.
+
+    """
+    (shm, a) = attachArrays(spec)
+    return shm, DrawStore(spec['info'], a['draws'], a['days']), [a['cum_main'], a['cum_special']]
+
+def attachWorker(spec):
+    # process pool initializer:  attach once per worker process
+    global _worker_arrays, _worker_shm
+    (_worker_shm, store, cum) = attachDrawStore(spec)
+    _worker_arrays = (store, cum)
+
+def initWorkerState(state):
+    # process pool initializer:  keep state once per worker process
+    global _worker_state
+    _worker_state = state
+
+def workerState(state=None):
+    # state if given, else the state of this worker process
+    return _worker_state if state is None else state
+
+def releaseBlock(shm, name):
+    # finalizer of the publishing process:  remove block, then close mapping
+    dbg.debug_output(f"releaseBlock({name})", color_fg='black', color_bg='cyan')
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        shm.close()
+    except BufferError:
+        # views still referenced elsewhere:  keep mapping until exit
+        _unclosed.append(shm)
+
+#############
+# CLASSES   #
+#############
+class SharedDrawArrays():
+    """
+    Draw arrays and cumulative counts of a DrawStore published in one
+    shared memory block.
+
+    Attributes
+    ----------
+    spec : picklable dictionary for attachArrays() / attachDrawStore():
+           block name, game info and (offset, shape, dtype) per array.
+    arrays : dictionary of numpy views of the block in this process.
+    """
+    def __init__(self, store, cum=None):
+        """
+        Parameters
+        ----------
+        store : DrawStore to publish.
+        cum : [main, special] cumulative counts (computed if None).
+
+        """
+        if cum is None:
+            cum = [la.cumulativeCounts(store, special=False), la.cumulativeCounts(store, special=True)]
+        sources = {'draws': store.draws, 'days': store.days, 'cum_main': cum[0], 'cum_special': cum[1]}
+
+        # layout:  arrays back to back at aligned offsets
+        layout = {}
+        size = 0
+        for (key, a) in sources.items():
+            layout[key] = (size, a.shape, a.dtype.str)
+            size += -(-a.nbytes // SHM_ALIGN) * SHM_ALIGN
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.spec = {'name': self.shm.name, 'info': store.info, 'arrays': layout}
+        dbg.debug_output(f"SharedDrawArrays({store}):  {self.shm.name}, {size:,d} bytes", color_fg='black', color_bg='cyan')
+
+        self.arrays = {}
+        for (key, a) in sources.items():
+            (offset, shape, dtype) = layout[key]
+            view = blockView(self.shm, offset, shape, dtype)
+            view[...] = a
+            self.arrays[key] = view
+        # unlink even if close() is never called
+        self.finalizer = weakref.finalize(self, releaseBlock, self.shm, self.shm.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return f"SharedDrawArrays({self.spec['name']}, {self.shm.size:,d} bytes)"
+
+    @property
+    def store(self):
+        return DrawStore(self.spec['info'], self.arrays['draws'], self.arrays['days'])
+
+    @property
+    def cum(self):
+        return [self.arrays['cum_main'], self.arrays['cum_special']]
+
+    def close(self):
+        # views must not be used after closing
+        self.arrays = {}
+        self.finalizer()